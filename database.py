@@ -11,6 +11,35 @@ load_dotenv()
 
 _DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), 'njuskalo.db')
 
+# Upsert of one scraped store; shared by single and batched saves
+_UPSERT_STORE_SQL = """
+    INSERT INTO scraped_stores
+        (url, results, is_valid, is_automoto, is_parts_only,
+         new_vehicle_count, used_vehicle_count, test_vehicle_count, total_vehicle_count,
+         updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+    ON CONFLICT(url) DO UPDATE SET
+        results             = excluded.results,
+        is_valid            = excluded.is_valid,
+        is_automoto         = excluded.is_automoto,
+        is_parts_only       = excluded.is_parts_only,
+        new_vehicle_count   = excluded.new_vehicle_count,
+        used_vehicle_count  = excluded.used_vehicle_count,
+        test_vehicle_count  = excluded.test_vehicle_count,
+        total_vehicle_count = excluded.total_vehicle_count,
+        updated_at          = datetime('now')
+"""
+
+# Marks a URL invalid, inserting a placeholder row if it is not known yet
+_MARK_INVALID_SQL = """
+    INSERT INTO scraped_stores (url, is_valid, is_automoto, results, updated_at)
+    VALUES (?, 0, 0, ?, datetime('now'))
+    ON CONFLICT(url) DO UPDATE SET
+        is_valid   = 0,
+        updated_at = datetime('now')
+"""
+_INVALID_URL_RESULTS = json.dumps({"error": "URL not accessible"})
+
 
 def _dict_factory(cursor, row):
     """Return rows as dicts."""
@@ -299,52 +328,44 @@ class NjuskaloDatabase:
             self.logger.error(f"Error retrieving snapshots for {url}: {e}")
             return []
 
+    @staticmethod
+    def _store_row(url: str, store_data: Dict[str, Any], is_valid: bool) -> tuple:
+        """Split the flag/count columns out of store_data and build an upsert row."""
+        data = dict(store_data)
+        is_automoto         = data.pop('has_auto_moto', False)
+        is_parts_only       = data.pop('is_parts_only', False)
+        new_vehicle_count   = data.pop('new_vehicle_count', 0)
+        used_vehicle_count  = data.pop('used_vehicle_count', 0)
+        test_vehicle_count  = data.pop('test_vehicle_count', 0)
+        total_vehicle_count = data.pop('total_vehicle_count', 0)
+        data.pop('categories', None)
+        return (
+            url,
+            json.dumps(data),
+            1 if is_valid else 0,
+            1 if is_automoto else 0,
+            1 if is_parts_only else 0,
+            new_vehicle_count,
+            used_vehicle_count,
+            test_vehicle_count,
+            total_vehicle_count,
+        )
+
     def save_store_data(self, url: str, store_data: Dict[str, Any], is_valid: bool = True) -> bool:
-        """Save or update store data in the database."""
-        is_automoto         = store_data.pop('has_auto_moto', False)
-        is_parts_only       = store_data.pop('is_parts_only', False)
-        new_vehicle_count   = store_data.pop('new_vehicle_count', 0)
-        used_vehicle_count  = store_data.pop('used_vehicle_count', 0)
-        test_vehicle_count  = store_data.pop('test_vehicle_count', 0)
-        total_vehicle_count = store_data.pop('total_vehicle_count', 0)
-        store_data.pop('categories', None)
+        """
+        Save or update store data in the database.
 
+        store_data is no longer modified: the flag, count and categories keys are
+        split out of a copy, so the caller's dict keeps them after the save.
+        """
+        row = self._store_row(url, store_data, is_valid)
         try:
-            self.connection.execute(
-                """
-                INSERT INTO scraped_stores
-                    (url, results, is_valid, is_automoto, is_parts_only,
-                     new_vehicle_count, used_vehicle_count, test_vehicle_count, total_vehicle_count,
-                     updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                ON CONFLICT(url) DO UPDATE SET
-                    results             = excluded.results,
-                    is_valid            = excluded.is_valid,
-                    is_automoto         = excluded.is_automoto,
-                    is_parts_only       = excluded.is_parts_only,
-                    new_vehicle_count   = excluded.new_vehicle_count,
-                    used_vehicle_count  = excluded.used_vehicle_count,
-                    test_vehicle_count  = excluded.test_vehicle_count,
-                    total_vehicle_count = excluded.total_vehicle_count,
-                    updated_at          = datetime('now')
-                """,
-                (
-                    url,
-                    json.dumps(store_data),
-                    1 if is_valid else 0,
-                    1 if is_automoto else 0,
-                    1 if is_parts_only else 0,
-                    new_vehicle_count,
-                    used_vehicle_count,
-                    test_vehicle_count,
-                    total_vehicle_count,
-                ),
-            )
+            self.connection.execute(_UPSERT_STORE_SQL, row)
             self.connection.commit()
             self.logger.info(
                 f"Saved store {url} "
-                f"(automoto={is_automoto}, parts_only={is_parts_only}, new={new_vehicle_count}, "
-                f"used={used_vehicle_count}, test={test_vehicle_count}, total={total_vehicle_count})"
+                f"(automoto={bool(row[3])}, parts_only={bool(row[4])}, new={row[5]}, "
+                f"used={row[6]}, test={row[7]}, total={row[8]})"
             )
             return True
         except sqlite3.Error as e:
@@ -352,19 +373,35 @@ class NjuskaloDatabase:
             self.connection.rollback()
             return False
 
+    def save_stores_bulk(self, stores: List[tuple]) -> int:
+        """
+        Save or update many stores in a single transaction.
+
+        Args:
+            stores: (url, store_data, is_valid) tuples
+
+        Returns:
+            Number of stores written (0 if the transaction was rolled back)
+        """
+        if not stores:
+            return 0
+        try:
+            self.connection.executemany(
+                _UPSERT_STORE_SQL,
+                [self._store_row(url, store_data, is_valid) for url, store_data, is_valid in stores],
+            )
+            self.connection.commit()
+            self.logger.info(f"Saved {len(stores)} stores in one batch")
+            return len(stores)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error saving batch of {len(stores)} stores: {e}")
+            self.connection.rollback()
+            return 0
+
     def mark_url_invalid(self, url: str) -> bool:
         """Mark a URL as invalid in the database."""
         try:
-            self.connection.execute(
-                """
-                INSERT INTO scraped_stores (url, is_valid, is_automoto, results, updated_at)
-                VALUES (?, 0, 0, ?, datetime('now'))
-                ON CONFLICT(url) DO UPDATE SET
-                    is_valid   = 0,
-                    updated_at = datetime('now')
-                """,
-                (url, json.dumps({"error": "URL not accessible"})),
-            )
+            self.connection.execute(_MARK_INVALID_SQL, (url, _INVALID_URL_RESULTS))
             self.connection.commit()
             self.logger.info(f"Marked URL as invalid: {url}")
             return True
@@ -373,6 +410,28 @@ class NjuskaloDatabase:
             self.connection.rollback()
             return False
 
+    def mark_urls_invalid(self, urls: List[str]) -> int:
+        """
+        Mark many URLs as invalid in a single transaction.
+
+        Args:
+            urls: URLs to mark
+
+        Returns:
+            Number of URLs marked (0 if the transaction was rolled back)
+        """
+        if not urls:
+            return 0
+        try:
+            self.connection.executemany(_MARK_INVALID_SQL, [(url, _INVALID_URL_RESULTS) for url in urls])
+            self.connection.commit()
+            self.logger.info(f"Marked {len(urls)} URLs as invalid in one batch")
+            return len(urls)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error marking batch of {len(urls)} URLs as invalid: {e}")
+            self.connection.rollback()
+            return 0
+
     def get_store_data(self, url: str) -> Optional[Dict]:
         """Retrieve store data for a specific URL."""
         try:
@@ -36,30 +36,49 @@ if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.
     else:
         print(f"Warning: Virtual environment not found at {venv_python}")
 
+import gc
 import time
 import random
 import json
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import logging
 import re
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from njuskalo_sitemap_scraper import NjuskaloSitemapScraper
+from njuskalo_sitemap_scraper import NjuskaloSitemapScraper, count_vehicle_phrases
 from database import NjuskaloDatabase
 
 logger = logging.getLogger(__name__)
 
+# Collect [href, innerText, textContent] for candidate category links in one WebDriver call,
+# walking selectors in priority order and skipping hrefs already seen
+_AUTO_MOTO_LINKS_JS = """
+const seen = new Set();
+const links = [];
+for (const sel of arguments[0]) {
+  for (const a of document.querySelectorAll(sel)) {
+    const href = (a.href || '').trim();
+    if (!href || seen.has(href)) continue;
+    seen.add(href);
+    const lower = href.toLowerCase();
+    if (lower.indexOf('categoryid=2') === -1 && lower.indexOf('category_id=2') === -1) continue;
+    links.push([href, a.innerText || '', a.textContent || '']);
+  }
+}
+return links;
+"""
+
 class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
     """Enhanced scraper with XML processing and vehicle counting capabilities."""
 
-    def __init__(self, headless: bool = False, use_database: bool = True):
+    def __init__(self, headless: bool = False, use_database: bool = True, block_assets: bool = False):
         """Initialize enhanced scraper."""
-        super().__init__(headless, use_database)
+        super().__init__(headless, use_database, block_assets=block_assets)
         self.xml_available = True  # Track if XML is accessible
 
     def _should_fetch_from_xml(self) -> bool:
@@ -256,39 +275,28 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
                 'a'
             ]
 
-            seen_hrefs = set()
-            for selector in link_selectors:
-                try:
-                    links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                except Exception:
-                    links = []
-
-                for link in links:
-                    try:
-                        href = (link.get_attribute('href') or '').strip()
-                        if not href or href in seen_hrefs:
-                            continue
-                        seen_hrefs.add(href)
-
-                        link_text = (link.text or '').strip().lower()
-                        text_content = (link.get_attribute('textContent') or '').strip().lower()
-                        if 'auto moto' not in link_text and 'auto moto' not in text_content:
-                            continue
+            # href/text/textContent for every candidate link arrive in a single round trip
+            try:
+                links = self.driver.execute_script(_AUTO_MOTO_LINKS_JS, link_selectors) or []
+            except Exception:
+                links = []
 
-                        href_lower = href.lower()
-                        if 'categoryid=2' not in href_lower and 'category_id=2' not in href_lower:
-                            continue
+            for href, inner_text, text_content in links:
+                try:
+                    link_text = (inner_text or '').strip().lower()
+                    if 'auto moto' not in link_text and 'auto moto' not in (text_content or '').strip().lower():
+                        continue
 
-                        normalized_url = self._normalize_auto_moto_url(href)
-                        total_ads = self._parse_count_from_text(link.get_attribute('textContent') or link.text or '')
+                    normalized_url = self._normalize_auto_moto_url(href)
+                    total_ads = self._parse_count_from_text(text_content or inner_text or '')
 
-                        logger.info(
-                            f"✅ Auto Moto link detected: {normalized_url} "
-                            f"(total near link: {total_ads if total_ads is not None else 'unknown'})"
-                        )
-                        return {'url': normalized_url, 'total_ads': total_ads}
-                    except Exception:
-                        continue
+                    logger.info(
+                        f"✅ Auto Moto link detected: {normalized_url} "
+                        f"(total near link: {total_ads if total_ads is not None else 'unknown'})"
+                    )
+                    return {'url': normalized_url, 'total_ads': total_ads}
+                except Exception:
+                    continue
 
             return None
         except Exception as e:
@@ -311,7 +319,8 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
     def _count_vehicle_types_on_current_page(self) -> Dict[str, int]:
         """
         Count new/used/test ads on current page using listing flags.
-        Uses a layered approach matching the proven detect_vehicle_flags pattern.
+        Uses a layered approach matching the proven detect_vehicle_flags pattern,
+        evaluated on a single lxml parse of the page source.
         """
         page_counts = {
             'new_vehicle_count': 0,
@@ -332,39 +341,41 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
                 return 'used_vehicle_count'
             return None
 
-        # Layer 1: li.entity-flag span.flag — primary selector used by the working parent scraper.
+        # Fetch page_source once; every layer below runs on the parsed tree
+        # instead of issuing WebDriver calls per element.
         try:
-            flag_spans = self.driver.find_elements(By.CSS_SELECTOR, 'li.entity-flag span.flag')
-            if flag_spans:
-                for span in flag_spans:
-                    key = _tally(span.text or '')
-                    if key:
-                        page_counts[key] += 1
-                total = (page_counts['new_vehicle_count']
-                         + page_counts['used_vehicle_count']
-                         + page_counts['test_vehicle_count'])
-                if total > 0:
-                    page_counts['total_vehicle_count'] = total
-                    return page_counts
-        except Exception:
-            pass
+            soup = self._parse_page_source()
+        except Exception as e:
+            logger.debug(f"Could not parse page source: {e}")
+            return page_counts
+
+        # Layer 1: li.entity-flag span.flag — primary selector used by the working parent scraper.
+        flag_spans = soup.select('li.entity-flag span.flag')
+        if flag_spans:
+            for span in flag_spans:
+                key = _tally(span.get_text(' ', strip=True))
+                if key:
+                    page_counts[key] += 1
+            total = (page_counts['new_vehicle_count']
+                     + page_counts['used_vehicle_count']
+                     + page_counts['test_vehicle_count'])
+            if total > 0:
+                page_counts['total_vehicle_count'] = total
+                return page_counts
 
         # Layer 2: li.entity-flag containers (text of whole container).
-        try:
-            flag_containers = self.driver.find_elements(By.CSS_SELECTOR, 'li.entity-flag')
-            if flag_containers:
-                for container in flag_containers:
-                    key = _tally(container.text or '')
-                    if key:
-                        page_counts[key] += 1
-                total = (page_counts['new_vehicle_count']
-                         + page_counts['used_vehicle_count']
-                         + page_counts['test_vehicle_count'])
-                if total > 0:
-                    page_counts['total_vehicle_count'] = total
-                    return page_counts
-        except Exception:
-            pass
+        flag_containers = soup.select('li.entity-flag')
+        if flag_containers:
+            for container in flag_containers:
+                key = _tally(container.get_text(' ', strip=True))
+                if key:
+                    page_counts[key] += 1
+            total = (page_counts['new_vehicle_count']
+                     + page_counts['used_vehicle_count']
+                     + page_counts['test_vehicle_count'])
+            if total > 0:
+                page_counts['total_vehicle_count'] = total
+                return page_counts
 
         # Layer 3: per-listing wrapper elements — flag sub-elements first, then full listing text.
         listing_selectors = [
@@ -376,71 +387,49 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
             '[data-testid="ad-item"]',
             '.classified-item',
         ]
-        listings = []
-        for selector in listing_selectors:
-            try:
-                found = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if found:
-                    listings = found
-                    break
-            except Exception:
-                continue
+        listings = self._select_first_matching(soup, listing_selectors)
 
         if listings:
             for listing in listings:
-                try:
-                    classified = False
-                    # Try flag sub-elements first
-                    try:
-                        flags = listing.find_elements(
-                            By.CSS_SELECTOR,
-                            'li.entity-flag span.flag, li.entity-flag, .entity-flag span.flag, .entity-flag'
-                        )
-                        for flag in flags:
-                            key = _tally(flag.text or '')
-                            if key:
-                                page_counts[key] += 1
-                                classified = True
-                                break
-                    except Exception:
-                        pass
-
-                    if not classified:
-                        # Fall back to full listing text + innerHTML
-                        searchable = (listing.text or '').lower()
-                        if not any(k in searchable for k in ('novo vozilo', 'rabljeno vozilo', 'polovno vozilo', 'testno vozilo')):
-                            try:
-                                searchable += ' ' + (listing.get_attribute('innerHTML') or '').lower()
-                            except Exception:
-                                pass
-                        key = _tally(searchable)
-                        if key:
-                            page_counts[key] += 1
-                            classified = True
-
-                    if not classified:
-                        page_counts['unclassified_count'] += 1
-                except Exception:
-                    continue
+                classified = False
+                # Try flag sub-elements first
+                flags = listing.select(
+                    'li.entity-flag span.flag, li.entity-flag, .entity-flag span.flag, .entity-flag'
+                )
+                for flag in flags:
+                    key = _tally(flag.get_text(' ', strip=True))
+                    if key:
+                        page_counts[key] += 1
+                        classified = True
+                        break
+
+                if not classified:
+                    # Fall back to full listing text + inner markup
+                    searchable = listing.get_text(' ', strip=True).lower()
+                    if not any(k in searchable for k in ('novo vozilo', 'rabljeno vozilo', 'polovno vozilo', 'testno vozilo')):
+                        searchable += ' ' + listing.decode_contents().lower()
+                    key = _tally(searchable)
+                    if key:
+                        page_counts[key] += 1
+                        classified = True
+
+                if not classified:
+                    page_counts['unclassified_count'] += 1
 
             page_counts['total_vehicle_count'] = len(listings)
             return page_counts
 
         # Layer 4: full body text count — last resort, counts string occurrences.
-        try:
-            body_text = self.driver.find_element(By.TAG_NAME, 'body').text.lower()
-            page_counts['test_vehicle_count'] = body_text.count('testno vozilo')
-            page_counts['new_vehicle_count'] = body_text.count('novo vozilo')
-            page_counts['used_vehicle_count'] = (
-                body_text.count('rabljeno vozilo') + body_text.count('polovno vozilo')
-            )
-            page_counts['total_vehicle_count'] = (
-                page_counts['new_vehicle_count']
-                + page_counts['used_vehicle_count']
-                + page_counts['test_vehicle_count']
-            )
-        except Exception:
-            pass
+        body = soup.body or soup
+        phrase_counts = count_vehicle_phrases(body.get_text(' ', strip=True).lower())
+        page_counts['test_vehicle_count'] = phrase_counts['testno']
+        page_counts['new_vehicle_count'] = phrase_counts['novo']
+        page_counts['used_vehicle_count'] = phrase_counts['rabljeno'] + phrase_counts['polovno']
+        page_counts['total_vehicle_count'] = (
+            page_counts['new_vehicle_count']
+            + page_counts['used_vehicle_count']
+            + page_counts['test_vehicle_count']
+        )
 
         return page_counts
 
@@ -449,8 +438,6 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
         Click the next page link/button in pagination using a real mouse click.
         Returns True if a click was performed, False if no next page element found.
         """
-        from selenium.webdriver.common.action_chains import ActionChains
-
         next_page_num = str(current_page + 1)
 
         # Priority 1: explicit "Next" / ">" button
@@ -463,15 +450,17 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
             '.pager .next:not(.disabled)',
             '[data-testid="next-page"]:not([disabled])',
         ]
-        for selector in next_selectors:
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, ', '.join(next_selectors))
+        except Exception:
+            elements = []
+        for el in elements:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for el in elements:
-                    classes = (el.get_attribute('class') or '').lower()
-                    if el.is_enabled() and 'disabled' not in classes:
-                        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-                        ActionChains(self.driver).move_to_element(el).pause(0.3).click(el).perform()
-                        return True
+                classes = (el.get_attribute('class') or '').lower()
+                if el.is_enabled() and 'disabled' not in classes:
+                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+                    ActionChains(self.driver).move_to_element(el).pause(0.3).click(el).perform()
+                    return True
             except Exception:
                 continue
 
@@ -521,26 +510,17 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
             '[data-testid="next-page"]:not([disabled])'
         ]
 
-        for selector in next_selectors:
-            try:
-                next_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in next_elements:
-                    classes = (element.get_attribute('class') or '').lower()
-                    if element.is_enabled() and 'disabled' not in classes:
-                        return True
-            except Exception:
-                continue
+        for element in self._extract_elements_batch(', '.join(next_selectors)):
+            if not element['disabled'] and 'disabled' not in element['className'].lower():
+                return True
 
         # Numeric pagination fallback: if there is a link/button for current_page + 1,
         # OR any page number higher than current_page (handles ellipsis/truncated pagination)
-        try:
-            candidates = self.driver.find_elements(By.CSS_SELECTOR, '.Pagination a, .Pagination button, .pagination a, .pagination button, .pager a, .pager button')
-            for candidate in candidates:
-                text = (candidate.text or '').strip()
-                if text.isdigit() and int(text) > current_page:
-                    return True
-        except Exception:
-            pass
+        candidates = self._extract_elements_batch('.Pagination a, .Pagination button, .pagination a, .pagination button, .pager a, .pager button')
+        for candidate in candidates:
+            text = candidate['text']
+            if text.isdigit() and int(text) > current_page:
+                return True
 
         # Ellipsis/truncated pagination: presence of '...' or '›' after current page means more pages exist
         try:
@@ -565,19 +545,11 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
 
     def _get_last_pagination_page(self) -> int:
         """Get last page number from Pagination controls."""
-        try:
-            elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                '.Pagination a, .Pagination button, .pagination a, .pagination button, .pager a, .pager button'
-            )
-            pages = []
-            for element in elements:
-                text = (element.text or '').strip()
-                if text.isdigit():
-                    pages.append(int(text))
-            return max(pages) if pages else 1
-        except Exception:
-            return 1
+        elements = self._extract_elements_batch(
+            '.Pagination a, .Pagination button, .pagination a, .pagination button, .pager a, .pager button'
+        )
+        pages = [int(element['text']) for element in elements if element['text'].isdigit()]
+        return max(pages) if pages else 1
 
     def check_auto_moto_category(self, store_url: str) -> bool:
         """
@@ -684,7 +656,6 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
 
                 # Click the Auto Moto category link to enter the filtered listing
                 try:
-                    from selenium.webdriver.common.action_chains import ActionChains
                     auto_moto_link = WebDriverWait(self.driver, 8).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[href*="categoryId=2"], a[href*="category_id=2"]'))
                     )
@@ -826,7 +797,8 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
             return
         url = random.choice(non_auto_urls)
         try:
-            self.driver.get(url)
+            # Through navigate_to so the decoy load also counts for store_visit pacing
+            self.navigate_to(url)
             time.sleep(random.uniform(3.0, 9.0))
             # Occasionally scroll a bit to mimic human reading
             if random.random() < 0.5:
@@ -915,6 +887,18 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
                 'total_vehicle_count': 0
             }
 
+    def _scrape_store_batch_parallel(self, store_urls: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Scrape a whole batch of stores in parallel, if this scraper supports it.
+
+        Args:
+            store_urls: Store URLs of the current phase
+
+        Returns:
+            Store data keyed by URL, or None to scrape the batch one store at a time
+        """
+        return None
+
     def run_enhanced_scrape(self, max_stores: int = None) -> Dict[str, any]:
         """
         Run the enhanced scraping workflow.
@@ -998,22 +982,27 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
             ) -> None:
                 """Process a batch of stores with random decoy visits interspersed."""
                 self._scrape_phase = phase_name
+                # Parallel workers scrape the whole batch up front; results are saved below as usual
+                prefetched = self._scrape_store_batch_parallel(store_urls)
                 for i, store_url in enumerate(store_urls, 1):
-                    # Random decoy before each real store visit (~25% chance)
-                    _maybe_decoy(decoy_pool)
-
                     try:
-                        logger.info(f"🔄 [{phase_name}] Scraping store {i}/{len(store_urls)}: {store_url}")
+                        if prefetched is not None:
+                            store_data = prefetched.get(store_url)
+                        else:
+                            # Random decoy before each real store visit (~25% chance)
+                            _maybe_decoy(decoy_pool)
+
+                            logger.info(f"🔄 [{phase_name}] Scraping store {i}/{len(store_urls)}: {store_url}")
 
-                        if not self.driver:
-                            logger.warning("⚠️ Browser driver missing before store scrape, reinitializing...")
-                            if not self.setup_browser():
-                                error_msg = f"Browser unavailable for store scrape: {store_url}"
-                                logger.error(f"❌ {error_msg}")
-                                results['errors'].append(error_msg)
-                                continue
+                            if not self.driver:
+                                logger.warning("⚠️ Browser driver missing before store scrape, reinitializing...")
+                                if not self.setup_browser():
+                                    error_msg = f"Browser unavailable for store scrape: {store_url}"
+                                    logger.error(f"❌ {error_msg}")
+                                    results['errors'].append(error_msg)
+                                    continue
 
-                        store_data = self.scrape_store_with_vehicle_counting(store_url)
+                            store_data = self.scrape_store_with_vehicle_counting(store_url)
 
                         if not store_data:
                             logger.warning(f"⚠️ No data retrieved for store: {store_url}")
@@ -1061,7 +1050,8 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
                                     is_valid=True
                                 )
 
-                        self.smart_sleep("store_visit")
+                        if prefetched is None:
+                            self.smart_sleep("store_visit")
 
                     except Exception as e:
                         logger.error(f"❌ Error scraping store {store_url}: {e}")
@@ -1069,6 +1059,9 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
                         if self.database:
                             self.database.mark_url_invalid(store_url)
                 self._scrape_phase = None
+                # Release the phase's pages and prefetched results before the next phase starts
+                prefetched = None
+                gc.collect()
 
             # Step 2: Classify only new stores (not yet in DB).
             # Decoy pool is empty at this point since we have no non-auto stores yet,
@@ -1144,7 +1137,7 @@ class EnhancedNjuskaloScraper(NjuskaloSitemapScraper):
         finally:
             # Cleanup
             if self.driver:
-                self.driver.quit()
+                self._quit_driver()
             if self.database:
                 self.database.disconnect()
 
@@ -39,7 +39,9 @@ elif not os.path.exists(venv_python):
     print(f"Warning: Virtual environment not found at {venv_python}")
 
 import time
+import atexit
 import logging
+import threading
 from typing import Optional, Dict, List
 from pathlib import Path
 
@@ -65,28 +67,210 @@ if SENTRY_DSN:
 
 # Import enhanced scraper
 from enhanced_njuskalo_scraper import EnhancedNjuskaloScraper
+from njuskalo_sitemap_scraper import quit_webdriver
 from selenium.webdriver.firefox.options import Options
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service
-import tempfile
+from selenium.common.exceptions import WebDriverException
 import random
-
-# Import tunnel manager
-try:
-    from ssh_tunnel_manager import SSHTunnelManager
-except ImportError:
-    print("❌ Error: ssh_tunnel_manager.py not found in current directory")
-    print("💡 Make sure ssh_tunnel_manager.py is in the same folder as this script")
-    sys.exit(1)
+import shutil
+import weakref
+import subprocess
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
+# Resolved geckodriver path, persisted so later runs skip the filesystem/PATH search
+GECKODRIVER_PATH_CACHE = Path.home() / ".cache" / "njuskalo" / "geckodriver_path"
+
+# Shared HTTP cache kept in RAM across runs, one subdirectory per connection mode,
+# so CSS/JS/images are not downloaded through the tunnel again for every new browser
+BROWSER_CACHE_DIR = "/dev/shm/njuskalo_cache"
+
+# Idle browsers kept alive between scrapes, keyed by (connection mode, headless).
+# Proxy prefs are fixed at launch, so a browser is only handed back to the same tunnel.
+# Entries are (driver, pid, released_at).
+_DRIVER_POOL: Dict[tuple, List[tuple]] = {}
+_DRIVER_POOL_LOCK = threading.Lock()
+
+# Most idle browsers kept across all tunnels; the least recently released is quit first
+DRIVER_POOL_MAX = int(os.getenv("NJUSKALO_DRIVER_POOL_MAX", "4"))
+
+
+def shutdown_driver_pool() -> None:
+    """Quit every idle pooled browser."""
+    with _DRIVER_POOL_LOCK:
+        entries = [entry for pooled in _DRIVER_POOL.values() for entry in pooled]
+        _DRIVER_POOL.clear()
+
+    for driver, pid, _released_at in entries:
+        try:
+            quit_webdriver(driver, pid)
+        except Exception as e:
+            logger.debug(f"Error quitting pooled browser: {e}")
+
+
+def _evict_idle_drivers(limit: int) -> None:
+    """Quit the least recently released pooled browsers until at most `limit` stay idle."""
+    evicted = []
+    with _DRIVER_POOL_LOCK:
+        while sum(len(pooled) for pooled in _DRIVER_POOL.values()) > limit:
+            _, key, index = min(
+                (entry[2], key, i) for key, pooled in _DRIVER_POOL.items() for i, entry in enumerate(pooled)
+            )
+            evicted.append(_DRIVER_POOL[key].pop(index))
+            if not _DRIVER_POOL[key]:
+                del _DRIVER_POOL[key]
+
+    for driver, pid, _released_at in evicted:
+        try:
+            quit_webdriver(driver, pid)
+        except Exception as e:
+            logger.debug(f"Error quitting evicted pooled browser: {e}")
+
+
+atexit.register(shutdown_driver_pool)
+
+# Rewrites prefs of the running browser; executed in the privileged (chrome) context
+_SET_PREFS_JS = """
+const prefs = arguments[0];
+for (const [name, value] of Object.entries(prefs)) {
+  if (typeof value === 'boolean') Services.prefs.setBoolPref(name, value);
+  else if (typeof value === 'number') Services.prefs.setIntPref(name, value);
+  else Services.prefs.setStringPref(name, value);
+}
+"""
+
+# Per-process scraper used by run_parallel_scrape workers
+_tunnel_worker_scraper = None
+
+
+def _init_tunnel_worker(headless: bool, tunnel_config_path: str, tunnel_name: str, socks_port: int,
+                        http_proxy_port: Optional[int] = None) -> None:
+    """Bind this pool worker to a tunnel already started by the parent process."""
+    global _tunnel_worker_scraper
+    scraper = TunnelEnabledEnhancedScraper(
+        headless=headless,
+        use_database=False,
+        tunnel_config_path=tunnel_config_path,
+        preferred_tunnel=tunnel_name,
+    )
+    # The parent owns the SSH process; workers only point Firefox at its port
+    scraper.current_tunnel = tunnel_name
+    scraper.current_connection_mode = tunnel_name
+    scraper.socks_proxy_port = socks_port
+    scraper.http_proxy_port = http_proxy_port
+    scraper.cache_slot = os.getpid()
+    _tunnel_worker_scraper = scraper
+    multiprocessing.util.Finalize(None, scraper.close, exitpriority=10)
+    # Per-worker caches are keyed by PID and would never be reused; drop them after close()
+    cache_dir = scraper._browser_cache_dir()
+    if cache_dir:
+        multiprocessing.util.Finalize(None, shutil.rmtree, args=(cache_dir, True), exitpriority=5)
+
+
+def _scrape_tunnel_store(store_url: str) -> Optional[Dict]:
+    """Scrape one store with this worker's tunnel-bound scraper (top-level so it is picklable)."""
+    return _tunnel_worker_scraper.scrape_store_with_vehicle_counting(store_url)
+
+
 class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
     """Enhanced scraper with SSH tunnel support and vehicle counting"""
 
     DIRECT_CONNECTION = "__DIRECT__"
 
-    def __init__(self, headless=False, use_database=True, tunnel_config_path=None, use_tunnels=True, preferred_tunnel=None):
+    # GeckoDriver path resolved once per process
+    _GECKODRIVER_PATH: Optional[str] = None
+
+    # Outcome of the Firefox self-test; a pass is remembered for the rest of the process
+    _firefox_sanity_ok: Optional[bool] = None
+
+    # Static Firefox prefs shared by every browser start; only UA, proxy and window size vary
+    _BASE_FIREFOX_PREFS: Dict[str, object] = {
+        # Server-specific preferences for stability
+        "browser.tabs.remote.autostart": False,
+        "layers.acceleration.disabled": True,
+        "gfx.webrender.force-disabled": True,
+        "gfx.webrender.all": False,
+        "gfx.x11-egl.force-disabled": True,
+        "dom.ipc.plugins.enabled": False,
+        "media.hardware-video-decoding.enabled": False,
+        "media.hardware-video-decoding.force-enabled": False,
+        "browser.startup.homepage": "about:blank",
+        "security.sandbox.content.level": 0,
+
+        # Enhanced anti-detection preferences
+        "dom.webdriver.enabled": False,
+        "useAutomationExtension": False,
+        "general.platform.override": "Linux x86_64",
+        "general.appversion.override": "5.0 (X11)",
+        "intl.accept_languages": "hr-HR, hr, en-US, en",
+
+        # Privacy and security preferences
+        "privacy.trackingprotection.enabled": False,
+        "dom.ipc.plugins.enabled.libflashplayer.so": False,
+        "media.peerconnection.enabled": False,
+        "media.navigator.enabled": False,
+        "webgl.disabled": True,
+        "javascript.enabled": True,
+
+        # Disable automation indicators
+        "marionette.enabled": False,
+        "fission.autostart": False,
+
+        # Performance preferences: HTTP cache on (see BROWSER_CACHE_DIR), offline cache off
+        "browser.cache.disk.enable": True,
+        "browser.cache.memory.enable": True,
+        "browser.cache.memory.capacity": 262144,  # KB
+        "browser.cache.memory.max_entry_size": 10240,  # KB
+        "browser.cache.offline.enable": False,
+        "network.http.use-cache": True,
+        "browser.cache.disk.smart_size.enabled": False,
+        "browser.cache.disk.capacity": 512 * 1024,  # KB
+        "media.cache_size": 0,
+
+        # Keep resolved hosts and idle connections around for the whole session, so
+        # repeat visits skip DNS (direct mode) and new SOCKS CONNECTs (tunnel mode)
+        "network.dnsCacheExpiration": 3600,
+        "network.dnsCacheExpirationGracePeriod": 600,
+        "network.dnsCacheEntries": 4000,
+        "network.http.keep-alive.timeout": 600,
+
+        # Multiplex requests over few warm TLS connections (each new one costs a tunnel handshake)
+        "network.http.http2.enabled": True,
+        "network.http.max-persistent-connections-per-server": 10,
+        "network.http.max-connections": 256,
+        "security.tls.enable_0rtt_data": True,
+
+        # Lean profile: no crash reporter, telemetry, sync, notifications or audio
+        "browser.tabs.crashReporting.sendReport": False,
+        "datareporting.healthreport.uploadEnabled": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "toolkit.telemetry.enabled": False,
+        "app.update.enabled": False,
+        "app.normandy.enabled": False,
+        "identity.fxaccounts.enabled": False,
+        "dom.webnotifications.enabled": False,
+        "dom.push.enabled": False,
+        "browser.safebrowsing.malware.enabled": False,
+        "browser.safebrowsing.phishing.enabled": False,
+        "extensions.pocket.enabled": False,
+        "media.autoplay.default": 5,
+        "media.volume_scale": "0.0",
+
+        # Timeouts for server-side issues
+        "network.http.connection-timeout": 30,
+        "network.http.response.timeout": 30,
+        "dom.max_script_run_time": 30,
+        "dom.max_chrome_script_run_time": 30,
+    }
+
+    # Static Firefox command-line arguments
+    _BASE_FIREFOX_ARGS = ("--no-sandbox", "--disable-dev-shm-usage")
+
+    def __init__(self, headless=False, use_database=True, tunnel_config_path=None, use_tunnels=True, preferred_tunnel=None, load_images=True, block_assets=False,
+                 hot_swap_proxy=False, workers=1):
         """
         Initialize enhanced scraper with SSH tunnel support
 
@@ -96,31 +280,56 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             tunnel_config_path: Path to tunnel configuration file
             use_tunnels: Enable/disable tunnel usage
             preferred_tunnel: Specific tunnel name to use (e.g., 'server2')
+            load_images: Load page images (store/listing pages are parsed as text only)
+            block_assets: Skip images, web fonts, known trackers and ASSET_BLOCKLIST hosts to save tunnel bandwidth
+            hot_swap_proxy: Keep one browser across rotations and only rewrite its proxy prefs
+            workers: Browser processes per tunnel; above 1, each phase is scraped in parallel
         """
         super().__init__(headless, use_database)
         self.use_tunnels = use_tunnels
         self.tunnel_config_path = tunnel_config_path or "tunnel_config.json"
         self.tunnel_manager = None
+        # Configured tunnel names, fixed once the manager has loaded its config
+        self._tunnel_names: tuple = ()
         self.current_tunnel = None
         self.socks_proxy_port = None
+        self.http_proxy_port = None
         self.preferred_tunnel = preferred_tunnel
+        self.load_images = load_images
+        self.block_assets = block_assets
+        self.hot_swap_proxy = hot_swap_proxy
+        self.workers = max(1, int(workers or 1))
         self.current_connection_mode = self.DIRECT_CONNECTION
         self.mix_direct_ip = use_tunnels and not bool(preferred_tunnel)
         self.stores_on_current_tunnel = 0
         self._next_rotation_after = random.randint(2, 5)
+        self._pending_browser_check = None
+        # Distinguishes cache directories of browsers sharing a connection mode (parallel workers)
+        self.cache_slot = None
 
         if self.use_tunnels:
             self._setup_tunnel_manager()
 
     def _setup_tunnel_manager(self):
-        """Initialize the SSH tunnel manager"""
+        """Initialize the SSH tunnel manager (imported here so --no-tunnels runs never load it)"""
+        try:
+            from ssh_tunnel_manager import SSHTunnelManager
+        except ImportError:
+            logger.error("❌ ssh_tunnel_manager.py not found - make sure it is in the same folder as this script")
+            self.use_tunnels = False
+            return
+
         try:
-            if not os.path.exists(self.tunnel_config_path):
+            if not os.path.isfile(self.tunnel_config_path):
                 logger.error(f"❌ Tunnel config file not found: {self.tunnel_config_path}")
                 self.use_tunnels = False
                 return
 
             self.tunnel_manager = SSHTunnelManager(self.tunnel_config_path)
+            self._tunnel_names = tuple(self.tunnel_manager.tunnels)
+            # Close SSH processes when the scraper is collected or the interpreter exits,
+            # even if run_enhanced_scrape_with_tunnels() never reached its finally block
+            weakref.finalize(self, self.tunnel_manager.close_all_tunnels)
             logger.info("✅ Tunnel manager initialized with config: " + self.tunnel_config_path)
         except Exception as e:
             logger.error(f"❌ Failed to initialize tunnel manager: {e}")
@@ -128,7 +337,6 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
 
     def _check_and_kill_port(self, port: int) -> bool:
         """Check if port is in use and kill the process using it"""
-        import subprocess
         try:
             # Check if port is in use
             result = subprocess.run(
@@ -167,7 +375,7 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                 if result.stdout:
                     logger.warning(f"⚠️ Port {port} appears to be in use")
                     return False
-            except:
+            except (OSError, subprocess.SubprocessError):
                 pass
             return False
         except Exception as e:
@@ -180,8 +388,8 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             return True
 
         try:
-            # Get available tunnels
-            tunnels = self.tunnel_manager.list_tunnels()
+            # Configured tunnels (plain dict; list_tunnels() would health-probe every port)
+            tunnels = self.tunnel_manager.tunnels
             if not tunnels:
                 logger.error("❌ No tunnels configured")
                 return False
@@ -190,7 +398,7 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             if tunnel_name:
                 if tunnel_name not in tunnels:
                     logger.error(f"❌ Requested tunnel '{tunnel_name}' not found in config")
-                    logger.info(f"Available tunnels: {', '.join(tunnels.keys())}")
+                    logger.info(f"Available tunnels: {', '.join(tunnels)}")
                     return False
             elif self.preferred_tunnel:
                 if self.preferred_tunnel in tunnels:
@@ -198,39 +406,42 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                     logger.info(f"🚇 Using preferred tunnel: {tunnel_name}")
                 else:
                     logger.error(f"❌ Preferred tunnel '{self.preferred_tunnel}' not found in config")
-                    logger.info(f"Available tunnels: {', '.join(tunnels.keys())}")
+                    logger.info(f"Available tunnels: {', '.join(tunnels)}")
                     return False
             else:
-                candidates = list(tunnels.keys())
-                if exclude_current and self.current_tunnel and len(candidates) > 1:
-                    candidates = [name for name in candidates if name != self.current_tunnel]
+                candidates = self._tunnel_names
+                if exclude_current and self.current_tunnel in tunnels and len(candidates) > 1:
+                    candidates = tuple(name for name in candidates if name != self.current_tunnel)
                 tunnel_name = random.choice(candidates)
                 logger.info(f"🚇 Starting SSH tunnel (random): {tunnel_name}")
 
             # Check if tunnel port is already in use and clean it up
-            tunnel_config = tunnels[tunnel_name]
-            local_port = tunnel_config['config']['local_port']
-            if self._check_and_kill_port(local_port):
-                logger.info(f"🧹 Cleaned up port {local_port}")
+            for local_port in (tunnels[tunnel_name].local_port, tunnels[tunnel_name].http_forward_port):
+                if local_port and self._check_and_kill_port(local_port):
+                    logger.info(f"🧹 Cleaned up port {local_port}")
 
             # Start the tunnel
             success = self.tunnel_manager.establish_tunnel(tunnel_name)
             if success:
                 proxy_settings = self.tunnel_manager.get_proxy_settings()
                 self.socks_proxy_port = proxy_settings.get('local_port') if proxy_settings else None
+                self.http_proxy_port = proxy_settings.get('http_proxy_port') if proxy_settings else None
                 self.current_tunnel = tunnel_name
                 self.current_connection_mode = tunnel_name
-                logger.info(f"✅ SSH tunnel active: {tunnel_name} (SOCKS proxy on port {self.socks_proxy_port})")
-
-                # Wait a moment for tunnel to stabilize (reduced)
-                time.sleep(1.5)
-
-                # Test tunnel connectivity
-                if self._test_tunnel_connectivity():
-                    logger.info("🎉 SSH tunnel is active - traffic will be routed through remote server")
+                if self.http_proxy_port:
+                    logger.info(f"✅ SSH tunnel active: {tunnel_name} (HTTP proxy on port {self.http_proxy_port})")
+                else:
+                    logger.info(f"✅ SSH tunnel active: {tunnel_name} (SOCKS proxy on port {self.socks_proxy_port})")
+
+                # Probe the proxy endpoint until it answers instead of sleeping blindly
+                probe_started = time.monotonic()
+                ready = self._test_tunnel_connectivity()
+                waited_ms = (time.monotonic() - probe_started) * 1000
+                if ready:
+                    logger.info(f"🎉 SSH tunnel is active after {waited_ms:.0f} ms - traffic will be routed through remote server")
                     return True
                 else:
-                    logger.error("❌ Tunnel connectivity test failed")
+                    logger.error(f"❌ Tunnel connectivity test failed after {waited_ms:.0f} ms")
                     return False
             else:
                 logger.error(f"❌ Failed to start tunnel: {tunnel_name}")
@@ -240,21 +451,39 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             logger.error(f"❌ Error starting tunnel: {e}")
             return False
 
-    def _test_tunnel_connectivity(self) -> bool:
-        """Test if the tunnel is working properly"""
-        if not self.socks_proxy_port:
+    def _test_tunnel_connectivity(self, timeout: float = 10.0) -> bool:
+        """
+        Test if the tunnel is working properly.
+
+        Sends a SOCKS5 greeting (no-auth) through the local port and waits for the
+        server's method selection, retrying with a 50 ms backoff until timeout.
+        Tunnels with an HTTP proxy are probed with an OPTIONS request instead; any
+        HTTP status line proves the remote proxy is answering.
+        Returns as soon as the proxy answers, so the generous timeout only costs
+        time on slow links.
+        """
+        if self.http_proxy_port:
+            port, greeting, expected = self.http_proxy_port, b"OPTIONS * HTTP/1.0\r\n\r\n", b"HTTP/"
+        elif self.socks_proxy_port:
+            port, greeting, expected = self.socks_proxy_port, b"\x05\x01\x00", b"\x05\x00"
+        else:
             return False
 
-        try:
-            import socket
-            # Test if SOCKS port is accessible
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            result = sock.connect_ex(('127.0.0.1', self.socks_proxy_port))
-            sock.close()
-            return result == 0
-        except:
-            return False
+        import socket
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=0.1) as sock:
+                    sock.settimeout(0.5)
+                    sock.sendall(greeting)
+                    if sock.recv(len(expected)) == expected:
+                        return True
+            except OSError:
+                pass
+
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
 
     def _stop_tunnel(self):
         """Stop the current SSH tunnel"""
@@ -267,6 +496,7 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             finally:
                 self.current_tunnel = None
                 self.socks_proxy_port = None
+                self.http_proxy_port = None
 
     def _switch_to_direct_connection(self):
         """Switch scraping traffic back to the server's original IP (no SOCKS proxy)."""
@@ -274,6 +504,7 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             self._stop_tunnel()
         self.current_tunnel = None
         self.socks_proxy_port = None
+        self.http_proxy_port = None
         self.current_connection_mode = self.DIRECT_CONNECTION
         logger.info("🌐 Using direct connection (original server IP)")
 
@@ -281,7 +512,7 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
         """Return configured tunnel names."""
         if not self.tunnel_manager:
             return []
-        return list(self.tunnel_manager.list_tunnels().keys())
+        return list(self._tunnel_names)
 
     def _ensure_browser_with_current_tunnel(self) -> bool:
         """Ensure browser exists and uses currently selected tunnel/proxy."""
@@ -324,9 +555,12 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                 f"after {self.stores_on_current_tunnel} store(s) during {active_phase}"
             )
 
-            if self.driver:
+            # With hot swapping the running browser is kept and re-pointed below;
+            # otherwise it is parked for reuse when this tunnel comes round again
+            hot_swap = self.hot_swap_proxy and self._driver_alive()
+            if self.driver and not hot_swap:
                 try:
-                    self.driver.quit()
+                    self.release_driver()
                 except Exception:
                     pass
                 self.driver = None
@@ -337,10 +571,22 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                 if self.current_tunnel and self.current_tunnel != target_mode:
                     self._stop_tunnel()
 
-                if not self._start_tunnel(tunnel_name=target_mode):
+                # The Firefox self-test does not need the tunnel; run it while SSH connects
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    if not self.driver and not self._has_pooled_driver(target_mode):
+                        self._pending_browser_check = executor.submit(self._prepare_browser)
+                    tunnel_started = self._start_tunnel(tunnel_name=target_mode)
+
+                if not tunnel_started:
+                    self._pending_browser_check = None
+                    if hot_swap:
+                        self._quit_driver()
                     logger.error(f"❌ Failed to switch to tunnel {target_mode}")
                     return False
 
+            if hot_swap and not self._apply_proxy_prefs():
+                self._quit_driver()
+
             self.stores_on_current_tunnel = 0
             self._next_rotation_after = random.randint(2, 5)
 
@@ -382,13 +628,29 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
         return result
 
     def test_firefox_local(self):
-        """Test if Firefox works locally without tunnels using server-compatible config"""
+        """
+        Test if Firefox works locally without tunnels using server-compatible config.
+
+        The throwaway test browser is only launched until the first pass in this
+        process; set FORCE_FIREFOX_RECHECK=1 to test before every browser start.
+        """
+        cls = TunnelEnabledEnhancedScraper
+        if os.environ.get("FORCE_FIREFOX_RECHECK"):
+            cls._firefox_sanity_ok = None
+        if cls._firefox_sanity_ok:
+            return True
+
+        cls._firefox_sanity_ok = self._run_firefox_local_test()
+        return cls._firefox_sanity_ok
+
+    def _run_firefox_local_test(self):
+        """Launch a throwaway headless Firefox and load a data URL"""
         try:
             logger.info("🧪 Testing Firefox installation locally with server config...")
 
             # Use server-compatible options
             test_options = Options()
-            test_options.headless = True
+            test_options.add_argument("-headless")
 
             # ALWAYS use system Firefox, not webdriver's bundled version
             firefox_binary = "/usr/bin/firefox"
@@ -407,8 +669,8 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             test_options.set_preference("network.proxy.type", 0)
 
             # Use system geckodriver
-            test_service = Service("/usr/local/bin/geckodriver")
-            test_driver = webdriver.Firefox(service=test_service, options=test_options)
+            test_service = Service(self._find_geckodriver() or "/usr/local/bin/geckodriver")
+            test_driver = webdriver.Firefox(service=test_service, options=test_options, keep_alive=True)
             test_driver.get("data:text/html,<html><body><h1>Firefox Server Test OK</h1></body></html>")
             test_driver.quit()
             logger.info("✅ Firefox server-compatible test: PASSED")
@@ -418,9 +680,39 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             return False
 
     def _find_geckodriver(self):
+        """
+        Find GeckoDriver, resolving it at most once per process.
+
+        GECKODRIVER_PATH in the environment wins; otherwise the path resolved on a
+        previous run is reused when still valid.
+        """
+        cls = TunnelEnabledEnhancedScraper
+        if cls._GECKODRIVER_PATH is None:
+            cls._GECKODRIVER_PATH = os.getenv("GECKODRIVER_PATH") or self._load_geckodriver_path()
+        return cls._GECKODRIVER_PATH
+
+    def _load_geckodriver_path(self):
+        """Return the cached GeckoDriver path, searching and caching it when missing or stale"""
+        cache_file = GECKODRIVER_PATH_CACHE
+        try:
+            cached_path = cache_file.read_text().strip()
+            if cached_path and os.access(cached_path, os.X_OK):
+                return cached_path
+        except OSError:
+            pass
+
+        geckodriver_path = self._resolve_geckodriver()
+        if geckodriver_path:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(geckodriver_path)
+            except OSError as e:
+                logger.debug(f"Could not cache geckodriver path: {e}")
+        return geckodriver_path
+
+    def _resolve_geckodriver(self):
         """Find GeckoDriver from multiple locations"""
         import glob
-        import shutil
 
         possible_paths = [
             "/usr/local/bin/geckodriver",
@@ -447,109 +739,238 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
 
         return None
 
-    def setup_browser(self) -> bool:
+    def _build_firefox_options(self, width: int, height: int) -> Options:
         """
-        Enhanced browser setup with SSH tunnel proxy support using Firefox.
+        Build Firefox options for the current connection mode (SOCKS proxy or direct).
+
+        Args:
+            width: Initial window width
+            height: Initial window height
+
+        Returns:
+            Configured Firefox Options
         """
+        firefox_options = Options()
+        # Return from get() on DOMContentLoaded instead of waiting for every subresource
+        firefox_options.page_load_strategy = "eager"
+
+        # ALWAYS use system Firefox, not webdriver's bundled version
+        firefox_binary = "/usr/bin/firefox"
+        if not os.path.exists(firefox_binary):
+            raise FileNotFoundError(f"System Firefox not found at {firefox_binary}. Install with: sudo apt-get install firefox")
+        firefox_options.binary_location = firefox_binary
+        logger.info(f"🦊 Using system Firefox: {firefox_binary}")
+
+        for name, value in self._BASE_FIREFOX_PREFS.items():
+            firefox_options.set_preference(name, value)
+
+        # Set user agent — use the shared pool from AntiDetectionMixin
+        self._session_user_agent = self.rotate_user_agent()
+        firefox_options.set_preference("general.useragent.override", self._session_user_agent)
+
+        cache_dir = self._browser_cache_dir()
+        if cache_dir:
+            firefox_options.set_preference("browser.cache.disk.parent_directory", cache_dir)
+
+        if not self.load_images or self.block_assets:
+            firefox_options.set_preference("permissions.default.image", 2)
+
+        # Asset blocking: nothing parsed by the scraper needs fonts or third-party trackers
+        if self.block_assets:
+            firefox_options.set_preference("gfx.downloadable_fonts.enabled", False)
+            firefox_options.set_preference("browser.display.use_document_fonts", 0)
+            firefox_options.set_preference("permissions.default.desktop-notification", 2)
+            firefox_options.set_preference("privacy.trackingprotection.enabled", True)
+            firefox_options.set_preference("browser.contentblocking.category", "strict")
+            firefox_options.set_preference("media.autoplay.blocking_policy", 2)
+
+        # 🔥 SOCKS PROXY CONFIGURATION 🔥
+        for name, value in self._proxy_prefs().items():
+            firefox_options.set_preference(name, value)
+
+        if self.use_tunnels and self.current_tunnel and self.http_proxy_port:
+            logger.info(f"🌐 Firefox configured to use HTTP proxy: 127.0.0.1:{self.http_proxy_port}")
+        elif self.use_tunnels and self.current_tunnel and self.socks_proxy_port:
+            logger.info(f"🌐 Firefox configured to use SOCKS proxy: 127.0.0.1:{self.socks_proxy_port}")
+        elif self.use_tunnels:
+            logger.info("🌐 Firefox configured for direct connection (original server IP)")
+
+        # Chrome-context script access is needed to rewrite proxy prefs at runtime
+        if self.hot_swap_proxy:
+            firefox_options.add_argument("-remote-allow-system-access")
+
+        # Server compatibility - ensure headless mode is properly set
+        if self.headless:
+            firefox_options.add_argument("-headless")
+
+        for argument in self._BASE_FIREFOX_ARGS:
+            firefox_options.add_argument(argument)
+        firefox_options.add_argument(f"--width={width}")
+        firefox_options.add_argument(f"--height={height}")
+
+        return firefox_options
+
+    def _browser_cache_dir(self) -> Optional[str]:
+        """Persistent tmpfs cache directory for the current connection mode, or None without /dev/shm."""
+        if not os.path.isdir("/dev/shm"):
+            return None
+        name = self.current_connection_mode.strip("_").lower()
+        if self.cache_slot is not None:
+            name = f"{name}-{self.cache_slot}"
+        cache_dir = os.path.join(BROWSER_CACHE_DIR, name)
         try:
-            # First test if Firefox works locally to isolate server-side issues
-            if not self.test_firefox_local():
-                logger.error("🚨 Firefox installation issue detected - aborting browser setup")
-                return False
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            logger.debug(f"Browser cache dir unavailable: {e}")
+            return None
+        return cache_dir
+
+    def _proxy_prefs(self) -> Dict[str, object]:
+        """Firefox proxy prefs for the current connection mode."""
+        if self.use_tunnels and self.current_tunnel and self.http_proxy_port:
+            # HTTP proxy at the far end (e.g. Squid): HTTPS goes through CONNECT, and the
+            # proxy keeps its own upstream keep-alive pool across page loads
+            return {
+                "network.proxy.type": 1,  # Manual proxy configuration
+                "network.proxy.http": "127.0.0.1",
+                "network.proxy.http_port": self.http_proxy_port,
+                "network.proxy.ssl": "127.0.0.1",
+                "network.proxy.ssl_port": self.http_proxy_port,
+                "network.proxy.socks": "",
+                "network.proxy.socks_port": 0,
+                "network.http.max-persistent-connections-per-proxy": 128,
+            }
+        if self.use_tunnels and self.current_tunnel and self.socks_proxy_port:
+            return {
+                "network.proxy.type": 1,  # Manual proxy configuration
+                "network.proxy.socks": "127.0.0.1",
+                "network.proxy.socks_port": self.socks_proxy_port,
+                "network.proxy.socks_version": 5,
+                "network.proxy.socks_remote_dns": True,
+                # Clear any HTTP proxy left by a hot swap from an HTTP-proxy tunnel
+                "network.proxy.http": "",
+                "network.proxy.ssl": "",
+                # Let one page load open more parallel streams through the tunnel (default 32)
+                "network.http.max-persistent-connections-per-proxy": 128,
+            }
+        return {"network.proxy.type": 0}
 
-            firefox_options = Options()
+    def _apply_proxy_prefs(self) -> bool:
+        """
+        Re-point the running browser at the current connection mode without a restart.
 
-            # Server-compatible configuration (exact setup that works)
-            firefox_options.headless = False
+        Cookies are cleared so sessions are not linked across exit IPs.
 
-            # ALWAYS use system Firefox, not webdriver's bundled version
-            firefox_binary = "/usr/bin/firefox"
-            if not os.path.exists(firefox_binary):
-                raise FileNotFoundError(f"System Firefox not found at {firefox_binary}. Install with: sudo apt-get install firefox")
-            firefox_options.binary_location = firefox_binary
-            logger.info(f"🦊 Using system Firefox: {firefox_binary}")
-
-            # Server-specific preferences for stability
-            firefox_options.set_preference("browser.tabs.remote.autostart", False)
-            firefox_options.set_preference("layers.acceleration.disabled", True)
-            firefox_options.set_preference("gfx.webrender.force-disabled", True)
-            firefox_options.set_preference("gfx.webrender.all", False)
-            firefox_options.set_preference("gfx.x11-egl.force-disabled", True)
-            firefox_options.set_preference("dom.ipc.plugins.enabled", False)
-            firefox_options.set_preference("media.hardware-video-decoding.enabled", False)
-            firefox_options.set_preference("media.hardware-video-decoding.force-enabled", False)
-            firefox_options.set_preference("browser.startup.homepage", "about:blank")
-            firefox_options.set_preference("security.sandbox.content.level", 0)
-
-            # Enhanced anti-detection preferences
-            firefox_options.set_preference("dom.webdriver.enabled", False)
-            firefox_options.set_preference("useAutomationExtension", False)
-            firefox_options.set_preference("general.platform.override", "Linux x86_64")
-            firefox_options.set_preference("general.appversion.override", "5.0 (X11)")
-
-            # Set user agent — use the shared pool from AntiDetectionMixin
-            firefox_options.set_preference("general.useragent.override", self.rotate_user_agent())
-
-            # Privacy and security preferences
-            firefox_options.set_preference("privacy.trackingprotection.enabled", False)
-            firefox_options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", False)
-            firefox_options.set_preference("media.peerconnection.enabled", False)
-            firefox_options.set_preference("media.navigator.enabled", False)
-            firefox_options.set_preference("webgl.disabled", True)
-            firefox_options.set_preference("javascript.enabled", True)
-
-            # Disable automation indicators
-            firefox_options.set_preference("marionette.enabled", False)
-            firefox_options.set_preference("fission.autostart", False)
-
-            # Performance preferences
-            firefox_options.set_preference("browser.cache.disk.enable", False)
-            firefox_options.set_preference("browser.cache.memory.enable", False)
-            firefox_options.set_preference("browser.cache.offline.enable", False)
-            firefox_options.set_preference("network.http.use-cache", False)
-
-            # 🔥 SOCKS PROXY CONFIGURATION 🔥
-            if self.use_tunnels and self.current_tunnel and self.socks_proxy_port:
-                # Configure SOCKS proxy in Firefox
-                firefox_options.set_preference("network.proxy.type", 1)  # Manual proxy configuration
-                firefox_options.set_preference("network.proxy.socks", "127.0.0.1")
-                firefox_options.set_preference("network.proxy.socks_port", self.socks_proxy_port)
-                firefox_options.set_preference("network.proxy.socks_version", 5)
-                firefox_options.set_preference("network.proxy.socks_remote_dns", True)
-                logger.info(f"🌐 Firefox configured to use SOCKS proxy: 127.0.0.1:{self.socks_proxy_port}")
-            else:
-                # Ensure direct connection when no active tunnel is selected
-                firefox_options.set_preference("network.proxy.type", 0)
-                if self.use_tunnels:
-                    logger.info("🌐 Firefox configured for direct connection (original server IP)")
+        Returns:
+            True if the prefs were rewritten
+        """
+        try:
+            with self.driver.context(self.driver.CONTEXT_CHROME):
+                self.driver.execute_script(_SET_PREFS_JS, self._proxy_prefs())
+            self.driver.delete_all_cookies()
+            logger.info(f"🔀 Browser proxy switched in place to {self.current_connection_mode}")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Proxy hot swap failed, restarting browser: {e}")
+            return False
+
+    def _pool_key(self) -> tuple:
+        """Pool key for the browser matching the current connection mode."""
+        return (self.current_connection_mode, self.headless)
+
+    def _has_pooled_driver(self, connection_mode: str) -> bool:
+        """Whether an idle browser is pooled for the given connection mode."""
+        with _DRIVER_POOL_LOCK:
+            return bool(_DRIVER_POOL.get((connection_mode, self.headless)))
+
+    def _prepare_browser(self) -> bool:
+        """Tunnel-independent start-up checks: Firefox self-test and GeckoDriver lookup."""
+        if not self.test_firefox_local():
+            logger.error("🚨 Firefox installation issue detected - aborting browser setup")
+            return False
+        if not self._find_geckodriver():
+            logger.error("❌ GeckoDriver not found")
+            return False
+        return True
+
+    def acquire_driver(self) -> bool:
+        """
+        Reuse an idle pooled browser for the current connection mode.
+
+        Returns:
+            True if a live browser was taken from the pool and attached to self.driver
+        """
+        key = self._pool_key()
+        while True:
+            with _DRIVER_POOL_LOCK:
+                pooled = _DRIVER_POOL.get(key)
+                if not pooled:
+                    return False
+                driver, pid, _released_at = pooled.pop()
+
+            try:
+                driver.current_url  # Liveness check - raises if the session died
+            except Exception:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                continue
+
+            self.driver = driver
+            self._driver_pid = pid
+            self._watch_driver()
+            logger.info(f"♻️ Reusing pooled Firefox session for {key[0]}")
+            return True
 
-            # Server compatibility - ensure headless mode is properly set
-            if self.headless:
-                firefox_options.headless = True
+    def release_driver(self) -> None:
+        """Return the current browser to the pool with cookies cleared instead of quitting it."""
+        if not self.driver:
+            return
 
-            # Additional Firefox arguments
-            firefox_options.add_argument("--no-sandbox")
-            firefox_options.add_argument("--disable-dev-shm-usage")
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+        except Exception as e:
+            logger.debug(f"Pooled browser reset failed, quitting it: {e}")
+            super()._quit_driver()
+            return
+
+        # The pool's own exit hook quits parked browsers from here on
+        self._unwatch_driver()
+        with _DRIVER_POOL_LOCK:
+            _DRIVER_POOL.setdefault(self._pool_key(), []).append((self.driver, self._driver_pid, time.monotonic()))
+        self.driver = None
+        self._driver_pid = None
+        _evict_idle_drivers(DRIVER_POOL_MAX)
+
+    def close(self):
+        """Release the browser and quit every pooled browser session."""
+        super().close()
+        shutdown_driver_pool()
+
+    def setup_browser(self) -> bool:
+        """
+        Enhanced browser setup with SSH tunnel proxy support using Firefox.
+        """
+        try:
+            pending, self._pending_browser_check = self._pending_browser_check, None
+            if self._driver_alive() or self.acquire_driver():
+                return True
+
+            # First test if Firefox works locally to isolate server-side issues
+            # (already started in parallel with the tunnel when rotating)
+            if not (pending.result() if pending else self._prepare_browser()):
+                return False
 
             # Set window size
             width = random.randint(1366, 1920)
             height = random.randint(768, 1080)
-            firefox_options.add_argument(f"--width={width}")
-            firefox_options.add_argument(f"--height={height}")
+            firefox_options = self._build_firefox_options(width, height)
 
             # Setup Firefox service with timeout configurations
             geckodriver_path = self._find_geckodriver()
-            if not geckodriver_path:
-                logger.error("❌ GeckoDriver not found")
-                return False
-
-            service = Service(geckodriver_path)
-
-            # Add timeout configurations for server-side issues
-            firefox_options.set_preference("network.http.connection-timeout", 30)
-            firefox_options.set_preference("network.http.response.timeout", 30)
-            firefox_options.set_preference("dom.max_script_run_time", 30)
-            firefox_options.set_preference("dom.max_chrome_script_run_time", 30)
+            service = Service(geckodriver_path, env=self._geckodriver_env())
 
             # Configure WebDriver with retry logic for connection issues
             logger.info("🔧 Starting Firefox WebDriver (checking for server-side issues)...")
@@ -561,14 +982,15 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                     if attempt > 0:
                         logger.info(f"🔄 Retry attempt {attempt + 1}/{max_retries}")
                         # Clean up any stale geckodriver processes
-                        import subprocess
                         try:
                             subprocess.run(['pkill', '-9', 'geckodriver'], timeout=2)
                             time.sleep(1)
-                        except:
+                        except (OSError, subprocess.SubprocessError):
                             pass
 
-                    self.driver = webdriver.Firefox(service=service, options=firefox_options)
+                    # keep_alive reuses one HTTP connection to geckodriver for every command
+                    self.driver = webdriver.Firefox(service=service, options=firefox_options, keep_alive=True)
+                    self._track_driver_process()
                     logger.info("✅ Firefox WebDriver started successfully")
                     break
 
@@ -588,29 +1010,30 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                     # Final attempt failed
                     logger.error(f"❌ Failed to start Firefox WebDriver after {max_retries} attempts: {e}")
                     logger.error(f"Geckodriver path: {geckodriver_path}")
-                    logger.error(f"Firefox binary: {firefox_binary}")
+                    logger.error(f"Firefox binary: {firefox_options.binary_location}")
                     logger.error(f"Headless mode: {self.headless}")
                     logger.error("Display issue: ensure DISPLAY=:3 is set (check DISPLAY_NUM in .env)")
 
                     # Try to clean up any zombie processes
                     try:
-                        import subprocess
                         subprocess.run(['pkill', '-9', 'firefox'], timeout=2)
                         subprocess.run(['pkill', '-9', 'geckodriver'], timeout=2)
-                    except:
+                    except (OSError, subprocess.SubprocessError):
                         pass
 
                     raise
 
             # Set shorter page load timeout to catch server issues
             self.driver.set_page_load_timeout(30)  # 30 seconds for page loads
-            self.driver.implicitly_wait(10)  # 10 seconds for element waits
+            self.driver.implicitly_wait(0)  # No implicit wait; page-ready checks use WebDriverWait
 
             # Set window size programmatically as well
             self.driver.set_window_size(width, height)
 
             # Apply full stealth suite via shared mixin method
             self._inject_stealth_scripts()
+            if self.block_assets:
+                self._install_asset_blocker()
 
             logger.info("✅ Firefox browser setup completed with tunnel integration")
             return True
@@ -651,10 +1074,10 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                 logger.error("   1. Try without tunnels: python script.py --no-tunnels")
                 logger.error("   2. Check system requirements")
 
-            if hasattr(self, 'driver') and self.driver:
+            if self.driver:
                 try:
                     self.driver.quit()
-                except:
+                except WebDriverException:
                     pass
                 self.driver = None
             return False
@@ -702,11 +1125,11 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
             logger.error(f"❌ Error in tunnel-enabled scraping: {e}")
             return {'error': str(e), 'stores_scraped': 0}
         finally:
-            # Cleanup browser
-            if hasattr(self, 'driver') and self.driver:
+            # Park the browser for the next scrape; close() shuts the pool down
+            if self.driver:
                 try:
-                    self.driver.quit()
-                    logger.info("Browser closed successfully")
+                    self.release_driver()
+                    logger.info("Browser released to the session pool")
                 except Exception as e:
                     logger.warning(f"Error closing browser: {e}")
 
@@ -715,6 +1138,123 @@ class TunnelEnabledEnhancedScraper(EnhancedNjuskaloScraper):
                 self._stop_tunnel()
 
 
+    def _scrape_store_batch_parallel(self, store_urls: List[str]) -> Optional[Dict[str, Dict]]:
+        """
+        Fan a phase out over every usable tunnel when more than one worker is requested.
+
+        The serial browser and tunnel are released first, since run_parallel_scrape
+        starts its own tunnels on the configured local ports.
+
+        Args:
+            store_urls: Store URLs of the current phase
+
+        Returns:
+            Store data keyed by URL, or None to fall back to the serial loop
+        """
+        if self.workers <= 1 or not self.use_tunnels or not store_urls:
+            return None
+
+        tunnel_names = [self.preferred_tunnel] if self.preferred_tunnel else self._configured_tunnel_names()
+        if not tunnel_names:
+            return None
+
+        if self.driver:
+            self._quit_driver()
+        self._stop_tunnel()
+
+        results = self.run_parallel_scrape(
+            store_urls,
+            tunnel_names=tunnel_names,
+            workers_per_tunnel=self.workers,
+            headless=self.headless,
+            tunnel_config_path=self.tunnel_config_path,
+        )
+        return {store_data['url']: store_data for store_data in results if store_data.get('url')}
+
+    @classmethod
+    def run_parallel_scrape(cls, store_urls: List[str], tunnel_names: Optional[List[str]] = None,
+                            workers_per_tunnel: int = 2, headless: bool = True,
+                            tunnel_config_path: str = "tunnel_config.json",
+                            max_stores: int = None) -> List[Dict]:
+        """
+        Scrape stores in parallel, with worker processes spread across SSH tunnels.
+
+        Each tunnel is started once in this process; every tunnel gets its own
+        process pool of workers_per_tunnel browsers that all exit through it.
+        Store URLs are dealt round-robin across tunnels.
+
+        Args:
+            store_urls: Store URLs to scrape
+            tunnel_names: Tunnels to use (defaults to all configured tunnels)
+            workers_per_tunnel: Browser processes per tunnel
+            headless: Whether worker browsers run headless
+            tunnel_config_path: Path to tunnel configuration file
+            max_stores: Maximum number of stores to scrape
+
+        Returns:
+            List of store results in completion order
+        """
+        if max_stores:
+            store_urls = store_urls[:max_stores]
+        if not store_urls:
+            return []
+
+        from ssh_tunnel_manager import SSHTunnelManager
+
+        tunnel_manager = SSHTunnelManager(tunnel_config_path)
+        tunnel_names = tunnel_names or list(tunnel_manager.tunnels)
+
+        active = {}
+        for name in tunnel_names:
+            if name in tunnel_manager.tunnels and tunnel_manager.establish_tunnel(name):
+                config = tunnel_manager.tunnels[name]
+                active[name] = (config.local_port, config.http_forward_port)
+            else:
+                logger.warning(f"⚠️ Skipping tunnel {name}: could not be established")
+
+        if not active:
+            logger.error("❌ No tunnels available for parallel scraping")
+            return []
+
+        names = list(active)
+        shards = {name: store_urls[i::len(names)] for i, name in enumerate(names)}
+        logger.info(
+            f"🔀 Parallel scrape of {len(store_urls)} stores across {len(names)} tunnel(s), "
+            f"{workers_per_tunnel} worker(s) each"
+        )
+
+        results = []
+        executors = []
+        try:
+            futures = []
+            for name, urls in shards.items():
+                if not urls:
+                    continue
+                executor = ProcessPoolExecutor(
+                    max_workers=max(1, min(workers_per_tunnel, len(urls))),
+                    initializer=_init_tunnel_worker,
+                    initargs=(headless, tunnel_config_path, name, *active[name]),
+                )
+                executors.append(executor)
+                futures.extend(executor.submit(_scrape_tunnel_store, url) for url in urls)
+
+            for future in as_completed(futures):
+                try:
+                    store_data = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Parallel store scrape failed: {e}")
+                    continue
+                if store_data:
+                    results.append(store_data)
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+            tunnel_manager.close_all_tunnels()
+
+        logger.info(f"✅ Completed parallel scraping of {len(results)} stores")
+        return results
+
+
 def main():
     """Main function for command line usage"""
     import argparse
@@ -726,6 +1266,10 @@ def main():
     parser.add_argument("--tunnel", help="Specific tunnel name to use")
     parser.add_argument("--no-tunnels", action="store_true", help="Disable tunnel usage")
     parser.add_argument("--no-database", action="store_true", help="Disable database usage")
+    parser.add_argument("--no-images", action="store_true", help="Do not load images in the browser")
+    parser.add_argument("--block-assets", action="store_true", help="Block images, web fonts and trackers to save tunnel bandwidth")
+    parser.add_argument("--hot-swap-proxy", action="store_true", help="Keep one browser across tunnel rotations and switch its proxy in place")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel browser processes per tunnel (1 = serial)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -744,7 +1288,11 @@ def main():
             use_database=not args.no_database,
             tunnel_config_path=args.tunnel_config,
             use_tunnels=not args.no_tunnels,
-            preferred_tunnel=args.tunnel
+            preferred_tunnel=args.tunnel,
+            load_images=not args.no_images,
+            block_assets=args.block_assets,
+            hot_swap_proxy=args.hot_swap_proxy,
+            workers=args.workers
         )
 
         # Run enhanced scraping
@@ -772,10 +1320,10 @@ def main():
         logger.error(f"❌ Fatal error: {e}")
         sys.exit(1)
     finally:
-        # Ensure scraper cleanup happens
+        # Ensure scraper cleanup happens; close() also quits the browsers parked in the session pool
         try:
-            if 'scraper' in locals() and hasattr(scraper, 'driver') and scraper.driver:
-                scraper.driver.quit()
+            if 'scraper' in locals():
+                scraper.close()
                 logger.info("Browser cleanup completed")
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
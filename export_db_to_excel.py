@@ -33,6 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for stores without snapshot history (never mutated)
+_NO_SNAPSHOT = {}
+
 
 def export_database_to_excel(
     filename: str = None,
@@ -111,41 +114,45 @@ def export_database_to_excel(
         if not filename.startswith(datadump_dir):
             filename = os.path.join(datadump_dir, filename)
 
-        # Build rows
-        df_data = []
+        # Build rows into a list sized up front (one allocation, no regrowth)
+        df_data = [None] * len(stores)
         for i, store_record in enumerate(stores, start=1):
-            store_data = store_record.get('results') or {}
+            # Bound once per store; the row below does ~20 lookups on these dicts
+            record_get = store_record.get
+            store_data = record_get('results') or {}
+            data_get = store_data.get
+            url = record_get('url', '')
 
             # ── Active vehicle counts (from last scrape, stored in scraped_stores) ──
-            db_new  = store_record.get('new_vehicle_count', 0) or 0
-            db_used = store_record.get('used_vehicle_count', 0) or 0
-            db_test = store_record.get('test_vehicle_count', 0) or 0
-            db_total = store_record.get('total_vehicle_count', 0) or 0
+            db_new  = record_get('new_vehicle_count', 0) or 0
+            db_used = record_get('used_vehicle_count', 0) or 0
+            db_test = record_get('test_vehicle_count', 0) or 0
+            db_total = record_get('total_vehicle_count', 0) or 0
 
             # Fallback to JSON blob if DB columns are all zero
             if db_new == 0 and db_used == 0 and db_test == 0:
-                db_new  = store_data.get('new_vehicle_count',  store_data.get('new_ads_count',  0)) or 0
-                db_used = store_data.get('used_vehicle_count', store_data.get('used_ads_count', 0)) or 0
-                db_test = store_data.get('test_vehicle_count', 0) or 0
+                db_new  = data_get('new_vehicle_count',  data_get('new_ads_count',  0)) or 0
+                db_used = data_get('used_vehicle_count', data_get('used_ads_count', 0)) or 0
+                db_test = data_get('test_vehicle_count', 0) or 0
                 db_total = db_new + db_used + db_test
 
             # ── Snapshot columns (defaults to 0 when no history exists) ──
-            snap = snapshots.get(store_record.get('url', ''), {})
-            active_new   = snap.get('active_new',   db_new)   or 0
-            active_used  = snap.get('active_used',  db_used)  or 0
-            active_test  = snap.get('active_test',  db_test)  or 0
-            active_total = snap.get('active_total', db_total) or 0
-            delta_new    = snap.get('delta_new',    0) or 0
-            delta_used   = snap.get('delta_used',   0) or 0
-            delta_test   = snap.get('delta_test',   0) or 0
-            delta_total  = snap.get('delta_total',  0) or 0
-
-            df_data.append({
+            snap_get = snapshots.get(url, _NO_SNAPSHOT).get
+            active_new   = snap_get('active_new',   db_new)   or 0
+            active_used  = snap_get('active_used',  db_used)  or 0
+            active_test  = snap_get('active_test',  db_test)  or 0
+            active_total = snap_get('active_total', db_total) or 0
+            delta_new    = snap_get('delta_new',    0) or 0
+            delta_used   = snap_get('delta_used',   0) or 0
+            delta_test   = snap_get('delta_test',   0) or 0
+            delta_total  = snap_get('delta_total',  0) or 0
+
+            df_data[i - 1] = {
                 'id':           i,
                 'vat':          '',
-                'name':         store_data.get('name', ''),
-                'subname':      store_data.get('subname', ''),
-                'address':      store_data.get('address', ''),
+                'name':         data_get('name', ''),
+                'subname':      data_get('subname', ''),
+                'address':      data_get('address', ''),
                 # current active counts
                 'active_new':   active_new,
                 'active_used':  active_used,
@@ -161,11 +168,11 @@ def export_database_to_excel(
                 'used':         active_used,
                 'test':         active_test,
                 'total':        active_total,
-                'url':           store_record.get('url', ''),
-                'is_automoto':   store_record.get('is_automoto', False),
-                'is_parts_only': store_record.get('is_parts_only', False),
-                'updated_at':    store_record.get('updated_at', ''),
-            })
+                'url':           url,
+                'is_automoto':   record_get('is_automoto', False),
+                'is_parts_only': record_get('is_parts_only', False),
+                'updated_at':    record_get('updated_at', ''),
+            }
 
         df = pd.DataFrame(df_data)
 
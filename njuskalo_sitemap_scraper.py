@@ -39,30 +39,58 @@ if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.
 
 import time
 import random
-import pandas as pd
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+import csv
 import gzip
-import xml.etree.ElementTree as ET
-import os
+import itertools
+from lxml import etree
+import soupsieve
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import logging
-from typing import List, Dict, Optional
+import hashlib
+import weakref
+import fcntl
+import gc
+import shutil
+import signal
+import subprocess
+import threading
+import multiprocessing.util
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 import re
 from bs4 import BeautifulSoup
-import os
 from database import NjuskaloDatabase
 import tempfile
-import tempfile
+
+# Optional xlsx writers, fastest first; save_to_excel falls back to openpyxl without them
+try:
+    from rustpy_xlsxwriter import FastExcel
+except ImportError:
+    FastExcel = None
+try:
+    import pyexcelerate
+except ImportError:
+    pyexcelerate = None
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 
 # Configure logging
+os.makedirs("logs", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -74,6 +102,565 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Export output directory, created on first use
+DATADUMP_DIR = "datadump"
+_DATADUMP_PREFIX = DATADUMP_DIR + os.sep
+_datadump_ready = False
+
+# Local HTML snapshots of fetched pages (opt-in via NJUSKALO_PAGE_CACHE_TTL seconds)
+PAGE_CACHE_DIR = os.path.join(DATADUMP_DIR, ".cache")
+
+# geckodriver creates each session's Firefox profile under TMPDIR; keep them in RAM when possible
+PROFILE_TMPFS_DIR = "/dev/shm/njuskalo_profiles"
+
+# Inflate .gz sitemaps in 128 KiB reads (CPython's own gzip read buffer size)
+READ_BUFFER_SIZE = 128 * 1024
+
+# Concurrent sitemap downloads; the HTTP session pool is sized to match
+SITEMAP_FETCH_WORKERS = 8
+
+# Delays measured from the last page load rather than slept in full after the work in between
+PACED_OPERATIONS = frozenset({"store_visit", "sitemap_download"})
+
+# Scraped stores buffered before they are written in one database transaction
+DB_BATCH_SIZE = 100
+
+# Namespace of <urlset>/<sitemapindex> documents
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_LOC_TAG = SITEMAP_NS + "loc"
+
+# Store-URL <loc> entries, for sitemaps too malformed to parse as XML
+_TRGOVINA_LOC_RE = re.compile(rb'<loc>(https://[^<]*?/trgovina/[^<]+)</loc>')
+
+# Store-page text patterns, compiled once for every store visit
+_ADS_DIGIT_RE = re.compile(r'(\d+)')
+# Every body-text fallback in one alternation, so a store page is scanned left to right once.
+# Ad counts and keywords ignore case; the postal-code pattern relies on the capitalised city.
+_STORE_TEXT_RE = re.compile(
+    r'(?P<oglas>\d+)\s+(?i:oglas[ai])'  # "123 oglasa" or "1 oglas"
+    r'|(?P<objava>\d+)\s+(?i:objav[ae])'  # "123 objave" or "1 objava"
+    r'|(?P<postal>\d{5}\s+[A-ZČĆŽŠĐ][a-zčćžšđ]+)'  # Postal code + city
+    r'|(?P<automobil>(?i:automobil))'  # also an "auto" hit, as in the old per-keyword counts
+    r'|(?P<keyword>(?i:auto|vozilo|motocikl|motor))'
+)
+# Vehicle condition phrases on listing pages, counted in one pass (input is lowercased)
+_VEHICLE_PHRASE_RE = re.compile(r'(testno|novo|rabljeno|polovno) vozilo')
+
+
+def count_vehicle_phrases(lower_text: str) -> Dict[str, int]:
+    """
+    Count 'testno/novo/rabljeno/polovno vozilo' occurrences in a single scan.
+
+    Args:
+        lower_text: Lowercased page text
+
+    Returns:
+        Occurrences keyed by condition word ('testno', 'novo', 'rabljeno', 'polovno')
+    """
+    counts = {'testno': 0, 'novo': 0, 'rabljeno': 0, 'polovno': 0}
+    for match in _VEHICLE_PHRASE_RE.finditer(lower_text):
+        counts[match.group(1)] += 1
+    return counts
+
+
+# Street + number; only searched when the page has no postal code
+_STREET_RE = re.compile(r'[A-ZČĆŽŠĐ][a-zčćžšđ]+\s+\d+[a-z]?')
+
+
+def _scan_store_text(text: str) -> Dict:
+    """
+    Collect the store-page text fallbacks in a single pass.
+
+    Args:
+        text: Visible text of the store page
+
+    Returns:
+        Dict with the first 'oglas' and 'objava' counts (or None), the address
+        candidate (or None) and the number of auto keyword hits
+    """
+    found = {'oglas': None, 'objava': None, 'postal': None, 'auto_keywords': 0}
+    for match in _STORE_TEXT_RE.finditer(text):
+        group = match.lastgroup
+        if group == 'automobil':
+            found['auto_keywords'] += 2
+        elif group == 'keyword':
+            found['auto_keywords'] += 1
+        elif found[group] is None:
+            found[group] = match.group(group)
+
+    if found['postal'] is None:
+        street = _STREET_RE.search(text)
+        if street:
+            found['postal'] = street.group(0)
+
+    ads = found['oglas'] or found['objava']
+    return {
+        'ads_count': int(ads) if ads else None,
+        'address': found['postal'],
+        'auto_keywords': found['auto_keywords'],
+    }
+
+
+# Store-page selector fallbacks, in priority order
+STORE_NAME_SELECTORS = [
+    'h1',
+    '.store-name',
+    '.shop-name',
+    '.entity-name',
+    '[data-testid="store-name"]',
+    '.profile-header h1',
+    '.seller-info h1',
+    '.store-title'
+]
+STORE_ADDRESS_SELECTORS = [
+    '.store-address',
+    '.shop-address',
+    '.address',
+    '[data-testid="store-address"]',
+    '.contact-info .address',
+    '.store-info .address',
+    '.profile-info .address',
+    '.seller-contact',
+    '.contact-details'
+]
+STORE_COUNT_SELECTORS = [
+    '.entities-count',
+    '.ads-count',
+    '.listings-count',
+    '[data-testid="entities-count"]',
+    '.entity-count',
+    '.total-ads'
+]
+# Links or elements that might indicate the Auto moto category
+STORE_CATEGORY_SELECTORS = [
+    'a[href*="categoryId=2"]',
+    'a[href*="/auti"]',
+    'a[href*="/auto"]',
+    'a[href*="/moto"]',
+    '.category-link',
+    '[data-category-id="2"]',
+    '.category-item'
+]
+
+# Selectors compiled once by soupsieve, so each store page only runs the matchers
+_COMPILED_SELECTORS = {
+    selector: soupsieve.compile(selector)
+    for selector in STORE_NAME_SELECTORS + STORE_ADDRESS_SELECTORS + STORE_COUNT_SELECTORS
+}
+_CATEGORY_MATCHER = soupsieve.compile(", ".join(STORE_CATEGORY_SELECTORS))
+
+# Persistent Firefox profiles reused across runs; one locked slot directory per concurrent browser
+PERSISTENT_PROFILE_ROOT = os.getenv("NJUSKALO_PROFILE_DIR", os.path.expanduser("~/.cache/njuskalo_ff_profile"))
+
+# Persistent profiles (and leaked tmpfs profiles) older than this many days are wiped
+PROFILE_MAX_AGE_DAYS = float(os.getenv("NJUSKALO_PROFILE_MAX_AGE_DAYS", "7"))
+
+# Clicks the first visible cookie-consent button among the given selectors, in-page
+_COOKIE_ACCEPT_JS = """
+for (const sel of arguments[0]) {
+  try {
+    const el = document.querySelector(sel);
+    if (el && el.offsetParent !== null && !el.disabled) { el.click(); return true; }
+  } catch (e) {}
+}
+return false;
+"""
+
+# Reads text/href/class/disabled of every element matching a selector in one round trip
+_ELEMENTS_BATCH_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(e => ({
+  text: (e.innerText || '').trim(),
+  href: e.href || e.getAttribute('href') || '',
+  className: e.getAttribute('class') || '',
+  disabled: !!e.disabled || e.hasAttribute('disabled')
+}));
+"""
+
+# Session-independent stealth overrides, joined once at import; per-session values are appended later
+_STEALTH_STATIC_JS = "\n".join([
+    # --- core webdriver flag ---
+    "try { Object.defineProperty(navigator, 'webdriver', {get: () => undefined, configurable: true}); } catch(e) {}",
+
+    # --- plugins (empty list is a dead giveaway) ---
+    """try {
+      const fakePlugins = [
+        {name:'PDF Viewer',filename:'internal-pdf-viewer',description:'Portable Document Format'},
+        {name:'Chrome PDF Viewer',filename:'mhjfbmdgcfjbbpaeojofohoefgiehjai',description:''},
+        {name:'Chromium PDF Viewer',filename:'internal-pdf-viewer',description:''},
+        {name:'Microsoft Edge PDF Viewer',filename:'edge-pdf-viewer',description:''},
+        {name:'WebKit built-in PDF',filename:'webkit-openpdf-plugin',description:''}
+      ];
+      Object.defineProperty(navigator, 'plugins', {get: () => fakePlugins, configurable: true});
+    } catch(e) {}""",
+
+    # --- languages ---
+    "try { Object.defineProperty(navigator, 'languages', {get: () => ['hr-HR', 'hr', 'en-US', 'en'], configurable: true}); } catch(e) {}",
+
+    # --- permissions API ---
+    """try {
+      const origQuery = window.Permissions && window.Permissions.prototype.query;
+      if (origQuery) {
+        window.Permissions.prototype.query = (params) =>
+          Promise.resolve({state: 'granted', onchange: null});
+      }
+    } catch(e) {}""",
+
+    # --- WebGL renderer masking ---
+    """try {
+      const getParameter = WebGLRenderingContext.prototype.getParameter;
+      WebGLRenderingContext.prototype.getParameter = function(param) {
+        if (param === 37445) return 'Intel Inc.';
+        if (param === 37446) return 'Intel Iris OpenGL Engine';
+        return getParameter.apply(this, arguments);
+      };
+    } catch(e) {}""",
+
+    # --- remove automation-related window properties ---
+    """try {
+      ['_phantom','__nightmare','_selenium','callPhantom','callSelenium',
+       '__webdriver_script_fn','__driver_evaluate','__webdriver_evaluate',
+       '__selenium_evaluate','__fxdriver_evaluate','__driver_unwrapped',
+       '__webdriver_unwrapped','__selenium_unwrapped','__fxdriver_unwrapped'
+      ].forEach(prop => { try { delete window[prop]; } catch(e) {} });
+    } catch(e) {}""",
+]) + "\n"
+
+def _prune_profile_dir(path: str, max_age_days: float) -> None:
+    """
+    Wipe a persistent profile slot once it is older than max_age_days.
+
+    Age is taken from a marker written when the slot was (re)created. The slot
+    lock file is kept, since the caller holds it.
+    """
+    marker = os.path.join(path, ".created")
+    try:
+        age_days = (time.time() - os.path.getmtime(marker)) / 86400
+    except OSError:
+        age_days = None
+
+    if age_days is not None and age_days > max_age_days:
+        for entry in os.listdir(path):
+            if entry == ".njuskalo.lock":
+                continue
+            entry_path = os.path.join(path, entry)
+            if os.path.isdir(entry_path) and not os.path.islink(entry_path):
+                shutil.rmtree(entry_path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    pass
+        logger.info(f"🧹 Pruned Firefox profile older than {max_age_days:g} days: {path}")
+        age_days = None
+
+    if age_days is None:
+        with open(marker, "w"):
+            pass
+
+
+def _purge_leaked_tmp_profiles(max_age_days: float) -> None:
+    """Remove temporary profiles left in the tmpfs profile dir by browsers that never quit."""
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        entries = os.listdir(PROFILE_TMPFS_DIR)
+    except OSError:
+        return
+    for entry in entries:
+        entry_path = os.path.join(PROFILE_TMPFS_DIR, entry)
+        try:
+            if os.path.isdir(entry_path) and os.path.getmtime(entry_path) < cutoff:
+                shutil.rmtree(entry_path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+# Manifest of the temporary stealth add-on, serialized once at import
+_STEALTH_ADDON_MANIFEST = json.dumps({
+    "manifest_version": 2,
+    "name": "njuskalo-stealth",
+    "version": "1.0",
+    "browser_specific_settings": {"gecko": {"id": "stealth@njuskalo.local"}},
+    "content_scripts": [{
+        "matches": ["<all_urls>"],
+        "js": ["stealth.js"],
+        "run_at": "document_start",
+        "all_frames": True,
+    }],
+})
+
+# Content script wrapper that runs the JSON-encoded stealth source as a page script
+_STEALTH_CONTENT_SCRIPT_TEMPLATE = """(function() {
+  const s = document.createElement('script');
+  s.textContent = %s;
+  (document.head || document.documentElement).appendChild(s);
+  s.remove();
+})();
+"""
+
+# Per-page check wrapped around the stealth source: returns true without re-running
+# the overrides when the add-on already applied them (a strict page CSP can block it)
+_STEALTH_GUARD_TEMPLATE = """if (navigator.webdriver === undefined) { return true; }
+%s
+return false;
+"""
+
+# Analytics, ad and beacon hosts cancelled in-browser when block_assets is on (WebExtension match patterns)
+ASSET_BLOCKLIST = [
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.doubleclick.net/*",
+    "*://*.googlesyndication.com/*",
+    "*://*.googleadservices.com/*",
+    "*://*.adservice.google.com/*",
+    "*://*.facebook.net/*",
+    "*://*.hotjar.com/*",
+    "*://*.clarity.ms/*",
+    "*://*.gemius.pl/*",
+    "*://*.dotmetrics.net/*",
+    "*://*.scorecardresearch.com/*",
+    "*://*.criteo.com/*",
+    "*://*.criteo.net/*",
+    "*://*.adnxs.com/*",
+    "*://*.adform.net/*",
+    "*://*.amazon-adsystem.com/*",
+    "*://*.pubmatic.com/*",
+    "*://*.rubiconproject.com/*",
+    "*://*.taboola.com/*",
+    "*://*.outbrain.com/*",
+]
+
+# Manifest and background script of the temporary asset-blocker add-on
+_ASSET_BLOCKER_MANIFEST = json.dumps({
+    "manifest_version": 2,
+    "name": "njuskalo-asset-blocker",
+    "version": "1.0",
+    "browser_specific_settings": {"gecko": {"id": "blocker@njuskalo.local"}},
+    "permissions": ["webRequest", "webRequestBlocking", "<all_urls>"],
+    "background": {"scripts": ["background.js"]},
+})
+_ASSET_BLOCKER_JS = (
+    "browser.webRequest.onBeforeRequest.addListener(\n"
+    "  () => ({cancel: true}),\n"
+    f"  {{urls: {json.dumps(ASSET_BLOCKLIST)}}},\n"
+    "  ['blocking']\n"
+    ");\n"
+)
+
+def _iter_sitemap_locs(xml_content, tag: str) -> Iterator[str]:
+    """
+    Stream the <loc> text of every <tag> entry in a sitemap document.
+
+    Each entry is cleared (and dropped from the root) once read, so memory stays
+    flat however many URLs the sitemap lists. The document is fed to the parser
+    in READ_BUFFER_SIZE slices, so a large bytes/bytearray input is never copied
+    whole.
+
+    Args:
+        xml_content: Sitemap XML as str, bytes or bytearray
+        tag: Entry element without namespace ('url' or 'sitemap')
+
+    Yields:
+        Stripped <loc> values
+    """
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode('utf-8')
+
+    parser = etree.XMLPullParser(
+        events=('end',), tag=SITEMAP_NS + tag,
+        resolve_entities=False, no_network=True, huge_tree=True,
+    )
+    view = memoryview(xml_content)
+    for start in range(0, len(view), READ_BUFFER_SIZE):
+        parser.feed(view[start:start + READ_BUFFER_SIZE].tobytes())
+        yield from _drain_sitemap_locs(parser)
+    parser.close()
+    yield from _drain_sitemap_locs(parser)
+
+
+def _drain_sitemap_locs(parser) -> Iterator[str]:
+    """Yield the <loc> text of the entries parsed so far, clearing each one."""
+    for _, elem in parser.read_events():
+        loc = elem.findtext(_LOC_TAG)
+        if loc:
+            yield loc.strip()
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+# Substrings (lowercase) that mark a sitemap as listing stores
+_STORE_SITEMAP_TOKENS = ('stores', 'trgovina')
+
+
+def _is_store_sitemap(lower_url: str) -> bool:
+    """Whether an already lowercased sitemap URL lists stores."""
+    return any(token in lower_url for token in _STORE_SITEMAP_TOKENS)
+
+
+def _export_path(filename: Optional[str], extension: str) -> str:
+    """
+    Resolve an export file name inside DATADUMP_DIR, creating the directory once per process.
+
+    Relative names are prefixed with the directory by plain concatenation;
+    absolute paths are used as given.
+
+    Args:
+        filename: Requested name (None for a timestamped default)
+        extension: Extension of the default name, e.g. '.xlsx'
+    """
+    global _datadump_ready
+    if not _datadump_ready:
+        os.makedirs(DATADUMP_DIR, exist_ok=True)
+        _datadump_ready = True
+
+    if not filename:
+        filename = f"{_DATADUMP_PREFIX}njuskalo_stores_{time.time_ns() // 1_000_000_000}{extension}"
+    elif not (filename.startswith(_DATADUMP_PREFIX) or os.path.isabs(filename)):
+        filename = _DATADUMP_PREFIX + filename
+    return filename
+
+
+# Single background thread for save_to_excel_async(); exports run one at a time
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel-export")
+
+# Column order of the store exports (Excel and streamed CSV)
+EXPORT_COLUMNS = ('id', 'vat', 'name', 'subname', 'address', 'total', 'new', 'used', 'test')
+# Write buffer for CSV exports; rows go out in a few large writes, not one per row
+CSV_BUFFER_SIZE = 1 << 20
+
+# Positions of the text and numeric export columns, for typed cell writers
+_EXPORT_TEXT_COLUMNS = (1, 2, 3, 4)
+_EXPORT_NUMBER_COLUMNS = (0, 5, 6, 7, 8)
+
+
+def _export_values(row_id: int, store: Dict) -> tuple:
+    """Map a scraped store dict onto one export row, in EXPORT_COLUMNS order."""
+    get = store.get
+    return (
+        row_id,  # Sequential ID
+        '',  # VAT - set as empty since no data available on scraped page
+        get('name', ''),  # Store name
+        get('subname', ''),  # Store subname/category
+        get('address', ''),  # Store address
+        get('ads_count', 0),  # Total number of ads (old ads_count)
+        get('new_ads_count', 0),  # New vehicle ads count
+        get('used_ads_count', 0),  # Used vehicle ads count
+        0,  # Test field - set to 0 for now
+    )
+
+
+def _export_row(row_id: int, store: Dict) -> Dict:
+    """Export row keyed by column name, for writers that take records."""
+    return dict(zip(EXPORT_COLUMNS, _export_values(row_id, store)))
+
+
+def _iter_export_values(stores) -> Iterator[tuple]:
+    """Yield each store's export values in EXPORT_COLUMNS order, numbering rows from 1."""
+    for row_id, store in enumerate(stores, start=1):
+        yield _export_values(row_id, store)
+
+
+def _write_xlsxwriter_sheet(workbook, name: str, stores) -> None:
+    """Add a worksheet to an xlsxwriter workbook holding the header and one row per store."""
+    worksheet = workbook.add_worksheet(name)
+    worksheet.write_row(0, 0, EXPORT_COLUMNS)
+    # Column types are fixed, so skip write_row's per-cell type sniffing;
+    # None/'' cells are left blank as write_row would
+    write_string = worksheet.write_string
+    write_number = worksheet.write_number
+    for row_index, values in enumerate(_iter_export_values(stores), start=1):
+        for col in _EXPORT_TEXT_COLUMNS:
+            if values[col]:
+                write_string(row_index, col, values[col])
+        for col in _EXPORT_NUMBER_COLUMNS:
+            if values[col] is not None:
+                write_number(row_index, col, values[col])
+
+
+def kill_process_tree(pid: int) -> None:
+    """SIGKILL a process and all of its descendants (walks /proc children lists)."""
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+
+    for child in children:
+        kill_process_tree(child)
+
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def quit_webdriver(driver, pid: Optional[int], timeout: float = 5.0) -> None:
+    """
+    Quit a WebDriver session without letting a hung browser outlive it.
+
+    If driver.quit() does not return within `timeout` seconds, the geckodriver
+    process tree (including Firefox) rooted at `pid` is killed.
+    """
+    watchdog = threading.Timer(timeout, kill_process_tree, args=(pid,)) if pid else None
+    if watchdog:
+        watchdog.daemon = True
+        watchdog.start()
+    try:
+        driver.quit()
+    finally:
+        if watchdog:
+            watchdog.cancel()
+
+
+def _finalize_webdriver(driver, pid: Optional[int], profile_tmpdir: Optional[str]) -> None:
+    """weakref.finalize callback: tear down a browser whose scraper never quit it."""
+    try:
+        quit_webdriver(driver, pid)
+    except Exception:
+        pass
+    if profile_tmpdir:
+        shutil.rmtree(profile_tmpdir, ignore_errors=True)
+
+
+# Per-process scraper used by scrape_many() workers; created once per worker process
+_worker_scraper = None
+# Whether pool workers pause between store visits like the sequential scrape does
+_worker_polite = False
+
+
+def _init_worker(headless: bool, polite: bool = False, block_assets: bool = False) -> None:
+    """Start one browser per pool worker and close it when the worker exits."""
+    global _worker_scraper, _worker_polite
+    _worker_polite = polite
+    _worker_scraper = NjuskaloSitemapScraper(headless=headless, use_database=False, block_assets=block_assets)
+    if not _worker_scraper.setup_browser():
+        logger.error("Pool worker failed to setup browser")
+    multiprocessing.util.Finalize(None, _worker_scraper.close, exitpriority=10)
+
+
+def _scrape_one(url: str) -> Optional[Dict]:
+    """Scrape a single store URL with this worker's browser (top-level so it is picklable)."""
+    if _worker_scraper is None or not _worker_scraper.driver:
+        return {
+            'url': url,
+            'name': None,
+            'address': None,
+            'ads_count': None,
+            'has_auto_moto': False,
+            'categories': [],
+            'new_ads_count': 0,
+            'used_ads_count': 0,
+            'error': 'Worker browser unavailable'
+        }
+    try:
+        return _worker_scraper.scrape_store_info(url)
+    finally:
+        if _worker_polite:
+            _worker_scraper.smart_sleep("store_visit")
+
+
 class AntiDetectionMixin:
     """Mixin class providing advanced anti-detection methods."""
 
@@ -116,21 +703,46 @@ class AntiDetectionMixin:
 
     def smart_sleep(self, operation_type: str = "store_visit",
                    min_seconds: float = None, max_seconds: float = None) -> None:
-        """Sleep with intelligent delays based on operation type."""
+        """
+        Sleep with intelligent delays based on operation type.
+
+        For PACED_OPERATIONS the delay is the gap wanted between page loads, so
+        time already spent since the last navigate_to() (page-load and extraction
+        pauses, parsing, database writes) counts towards it instead of stacking.
+        """
         delay = self.get_smart_delay(
             min_seconds or 5.0,
             max_seconds or 15.0,
             operation_type
         )
+        last_navigation = getattr(self, '_last_navigation_at', None)
+        if operation_type in PACED_OPERATIONS and last_navigation is not None:
+            elapsed = time.monotonic() - last_navigation
+            logger.debug(f"Pacing {operation_type}: {delay:.1f}s gap, {elapsed:.1f}s already elapsed")
+            delay -= elapsed
+        if delay <= 0:
+            return
         logger.debug(f"Sleeping {delay:.1f}s for {operation_type}")
         time.sleep(delay)
 
     def add_human_behavior(self) -> None:
-        """Add realistic human-like behavior patterns."""
+        """
+        Add realistic human-like behavior patterns.
+
+        Skipped entirely when anti_bot is disabled. Pointer movements are also
+        skipped in headless mode, where they cost a WebDriver round trip each
+        but are never seen by the page as real input.
+        """
+        if not getattr(self, 'anti_bot', True):
+            return
+
         try:
+            if getattr(self, 'headless', False):
+                self.human_scroll_pattern()
+                return
+
             # Random mouse movements
             if hasattr(self, 'driver') and self.driver:
-                from selenium.webdriver.common.action_chains import ActionChains
                 actions = ActionChains(self.driver)
 
                 # Get window size for realistic movements
@@ -156,6 +768,9 @@ class AntiDetectionMixin:
 
     def human_scroll_pattern(self) -> None:
         """Simulate realistic human scrolling patterns."""
+        if not getattr(self, 'anti_bot', True):
+            return
+
         try:
             if hasattr(self, 'driver') and self.driver:
                 # Scroll down in chunks (reduced iterations and wait times)
@@ -230,17 +845,23 @@ class AntiDetectionMixin:
                 ".cookie-consent-accept"
             ]
 
-            for selector in cookie_selectors:
+            # Try every candidate in one script call instead of a timed wait per selector
+            clicked = self.driver.execute_script(_COOKIE_ACCEPT_JS, cookie_selectors)
+
+            if not clicked:
+                # Banner may still be rendering: one short wait on the most likely button
                 try:
                     cookie_button = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, cookie_selectors[0]))
                     )
                     cookie_button.click()
-                    logger.info("Cookie banner accepted")
-                    self.smart_sleep("data_extraction", min_seconds=0.5, max_seconds=2.0)
-                    return
+                    clicked = True
                 except TimeoutException:
-                    continue
+                    pass
+
+            if clicked:
+                logger.info("Cookie banner accepted")
+                self.smart_sleep("data_extraction", min_seconds=0.5, max_seconds=2.0)
 
         except Exception as e:
             logger.debug(f"No cookie banner found or error accepting: {e}")
@@ -261,15 +882,98 @@ class AntiDetectionMixin:
         - AudioContext fingerprint → slight per-session noise
         - WebGL renderer info  → masked
         - Permissions API      → always returns 'granted'
+
+        All overrides run as one fused script, built once per browser session so
+        the fingerprint stays stable across pages. The first call of a session
+        installs it as a document_start content script. Pages are still checked
+        (and injected directly if needed) until one confirms the add-on's
+        overrides are active, since a page's Content-Security-Policy can block
+        the add-on's inline script; after that, calls return without touching
+        the WebDriver channel.
         """
         if not hasattr(self, 'driver') or not self.driver:
             return
 
-        # Determine platform hint from the UA already set for this session
+        session_id = getattr(self.driver, 'session_id', None)
+        if getattr(self, '_stealth_session_id', None) != session_id or not getattr(self, '_stealth_source', None):
+            self._stealth_source = self._build_stealth_source()
+            self._stealth_session_id = session_id
+            self._stealth_guarded_source = _STEALTH_GUARD_TEMPLATE % self._stealth_source
+            self._stealth_addon_installed = self._install_stealth_addon(self._stealth_source)
+            self._stealth_addon_confirmed = False
+        elif getattr(self, '_stealth_addon_confirmed', False):
+            return
+
+        try:
+            already_active = self.driver.execute_script(self._stealth_guarded_source)
+            if already_active and self._stealth_addon_installed:
+                self._stealth_addon_confirmed = True
+        except Exception as ex:
+            logger.debug(f"Stealth script skipped: {ex}")
+
+    def _install_stealth_addon(self, source: str) -> bool:
+        """
+        Install a temporary WebExtension that runs the stealth source at document_start.
+
+        The content script inserts the source as a page script in every frame before
+        site scripts run, so no per-page execute_script is needed.
+
+        Returns:
+            True if the add-on was installed
+        """
         try:
-            ua = self.driver.execute_script("return navigator.userAgent;") or ""
-        except Exception:
-            ua = ""
+            self._install_temporary_addon({
+                "manifest.json": _STEALTH_ADDON_MANIFEST,
+                "stealth.js": _STEALTH_CONTENT_SCRIPT_TEMPLATE % json.dumps(source),
+            })
+            return True
+        except Exception as ex:
+            logger.debug(f"Stealth add-on not installed, falling back to per-page injection: {ex}")
+            return False
+
+    def _install_asset_blocker(self) -> bool:
+        """
+        Install a temporary WebExtension that cancels requests to ASSET_BLOCKLIST hosts.
+
+        Blocked requests never leave the browser, so analytics and ad beacons cost
+        no proxy round trip. Tracking protection needs downloaded lists; this does not.
+
+        Returns:
+            True if the add-on was installed
+        """
+        if not hasattr(self, 'driver') or not self.driver:
+            return False
+        try:
+            self._install_temporary_addon({
+                "manifest.json": _ASSET_BLOCKER_MANIFEST,
+                "background.js": _ASSET_BLOCKER_JS,
+            })
+            logger.debug(f"Asset blocker installed ({len(ASSET_BLOCKLIST)} patterns)")
+            return True
+        except Exception as ex:
+            logger.debug(f"Asset blocker add-on not installed: {ex}")
+            return False
+
+    def _install_temporary_addon(self, files: Dict[str, str]) -> None:
+        """Write an unpacked add-on to a temp dir and install it for this session only."""
+        addon_dir = tempfile.mkdtemp(prefix="njuskalo_addon_")
+        try:
+            for name, content in files.items():
+                with open(os.path.join(addon_dir, name), "w") as f:
+                    f.write(content)
+            self.driver.install_addon(addon_dir, temporary=True)
+        finally:
+            shutil.rmtree(addon_dir, ignore_errors=True)
+
+    def _build_stealth_source(self) -> str:
+        """Build the fused stealth script for the current browser session."""
+        # Determine platform hint from the UA already set for this session
+        ua = getattr(self, '_session_user_agent', None)
+        if not ua:
+            try:
+                ua = self.driver.execute_script("return navigator.userAgent;") or ""
+            except Exception:
+                ua = ""
         if "Windows" in ua:
             platform_str = "Win32"
         elif "Macintosh" in ua:
@@ -283,24 +987,6 @@ class AntiDetectionMixin:
         canvas_noise = random.randint(1, 9)
 
         scripts = [
-            # --- core webdriver flag ---
-            "try { Object.defineProperty(navigator, 'webdriver', {get: () => undefined, configurable: true}); } catch(e) {}",
-
-            # --- plugins (empty list is a dead giveaway) ---
-            """try {
-              const fakePlugins = [
-                {name:'PDF Viewer',filename:'internal-pdf-viewer',description:'Portable Document Format'},
-                {name:'Chrome PDF Viewer',filename:'mhjfbmdgcfjbbpaeojofohoefgiehjai',description:''},
-                {name:'Chromium PDF Viewer',filename:'internal-pdf-viewer',description:''},
-                {name:'Microsoft Edge PDF Viewer',filename:'edge-pdf-viewer',description:''},
-                {name:'WebKit built-in PDF',filename:'webkit-openpdf-plugin',description:''}
-              ];
-              Object.defineProperty(navigator, 'plugins', {get: () => fakePlugins, configurable: true});
-            } catch(e) {}""",
-
-            # --- languages ---
-            "try { Object.defineProperty(navigator, 'languages', {get: () => ['hr-HR', 'hr', 'en-US', 'en'], configurable: true}); } catch(e) {}",
-
             # --- platform ---
             f"try {{ Object.defineProperty(navigator, 'platform', {{get: () => '{platform_str}', configurable: true}}); }} catch(e) {{}}",
 
@@ -308,15 +994,6 @@ class AntiDetectionMixin:
             f"try {{ Object.defineProperty(navigator, 'hardwareConcurrency', {{get: () => {cpu_count}, configurable: true}}); }} catch(e) {{}}",
             f"try {{ Object.defineProperty(navigator, 'deviceMemory', {{get: () => {mem_gb}, configurable: true}}); }} catch(e) {{}}",
 
-            # --- permissions API ---
-            """try {
-              const origQuery = window.Permissions && window.Permissions.prototype.query;
-              if (origQuery) {
-                window.Permissions.prototype.query = (params) =>
-                  Promise.resolve({state: 'granted', onchange: null});
-              }
-            } catch(e) {}""",
-
             # --- canvas noise ---
             f"""try {{
               const origToDataURL = HTMLCanvasElement.prototype.toDataURL;
@@ -343,32 +1020,10 @@ class AntiDetectionMixin:
                 return result;
               }};
             }} catch(e) {{}}""",
-
-            # --- WebGL renderer masking ---
-            """try {
-              const getParameter = WebGLRenderingContext.prototype.getParameter;
-              WebGLRenderingContext.prototype.getParameter = function(param) {
-                if (param === 37445) return 'Intel Inc.';
-                if (param === 37446) return 'Intel Iris OpenGL Engine';
-                return getParameter.apply(this, arguments);
-              };
-            } catch(e) {}""",
-
-            # --- remove automation-related window properties ---
-            """try {
-              ['_phantom','__nightmare','_selenium','callPhantom','callSelenium',
-               '__webdriver_script_fn','__driver_evaluate','__webdriver_evaluate',
-               '__selenium_evaluate','__fxdriver_evaluate','__driver_unwrapped',
-               '__webdriver_unwrapped','__selenium_unwrapped','__fxdriver_unwrapped'
-              ].forEach(prop => { try { delete window[prop]; } catch(e) {} });
-            } catch(e) {}""",
         ]
 
-        for script in scripts:
-            try:
-                self.driver.execute_script(script)
-            except Exception as ex:
-                logger.debug(f"Stealth script skipped: {ex}")
+        # Every override is wrapped in its own try/catch, so one failing cannot skip the rest
+        return _STEALTH_STATIC_JS + "\n".join(scripts)
 
     def navigate_to(self, url: str, inject_stealth: bool = True) -> bool:
         """
@@ -378,6 +1033,7 @@ class AntiDetectionMixin:
         signals hidden on every page.
         """
         try:
+            self._last_navigation_at = time.monotonic()
             self.driver.get(url)
             if inject_stealth:
                 self._inject_stealth_scripts()
@@ -390,34 +1046,68 @@ class AntiDetectionMixin:
 class NjuskaloSitemapScraper(AntiDetectionMixin):
     """Web scraper for Njuskalo stores using sitemap approach."""
 
-    def __init__(self, headless: bool = False, use_database: bool = True):
+    def __init__(self, headless: bool = False, use_database: bool = True, anti_bot: bool = True,
+                 block_assets: bool = False):
         """
         Initialize the scraper with Firefox WebDriver.
 
         Args:
             headless: Whether to run Firefox in headless mode
             use_database: Whether to use database for storing results
+            anti_bot: Whether to simulate mouse/scroll behavior between page loads
+            block_assets: Skip images, media, web fonts and trackers (pages are parsed as text)
         """
         self.driver = None
         self.base_url = os.getenv("NJUSKALO_BASE_URL", "https://www.njuskalo.hr")
         self.sitemap_index_url = os.getenv("NJUSKALO_SITEMAP_INDEX_URL", "https://www.njuskalo.hr/sitemap-index.xml")
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0'
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0',
+            # Only encodings urllib3 can decode here (br/zstd need optional packages)
+            'Accept-Encoding': ACCEPT_ENCODING,
+            # The session only fetches sitemaps; ask for the raw XML document
+            'Accept': 'application/xml, text/xml;q=0.9, */*;q=0.1',
+            'Connection': 'keep-alive',
         })
+        # One keep-alive pool reused by every sitemap and .gz fetch, large enough
+        # for SITEMAP_FETCH_WORKERS concurrent downloads
+        adapter = HTTPAdapter(pool_connections=SITEMAP_FETCH_WORKERS, pool_maxsize=2 * SITEMAP_FETCH_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._session_cookies_synced_for = None
+        # Store writes queued by iter_stores() until the next batched flush
+        self._pending_saves: List[tuple] = []
+        self._pending_invalids: List[str] = []
         self.headless = headless
         self.use_database = use_database
+        self.anti_bot = anti_bot
+        self.block_assets = block_assets
+        self.page_cache_ttl = int(os.getenv("NJUSKALO_PAGE_CACHE_TTL", "0"))
         self.database = None
         self.stores_data = []
         self.logger = logger
+        self._driver_pid = None
+        self._profile_tmpdir = None
+        self._profile_lock_fd = None
+        self._driver_finalizer = None
 
     def setup_browser(self) -> bool:
-        """Set up Firefox WebDriver with server-compatible configuration."""
+        """
+        Set up Firefox WebDriver with server-compatible configuration.
+
+        A live browser is kept as is, so calling this again (discovery, then
+        scraping) never launches a second Firefox on the same profile slot.
+        """
+        if self._driver_alive():
+            return True
+        if self.driver:
+            # Dead session: free its processes and profile slot before relaunching
+            self._quit_driver()
+
         try:
             firefox_options = Options()
-
-            # Server-compatible configuration (exact setup that works)
-            firefox_options.headless = False
+            # Return from get() on DOMContentLoaded instead of waiting for every subresource
+            firefox_options.page_load_strategy = "eager"
 
             # ALWAYS use system Firefox, not webdriver's bundled version
             firefox_binary = "/usr/bin/firefox"
@@ -443,8 +1133,11 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             firefox_options.set_preference("general.platform.override", "Linux x86_64")
             firefox_options.set_preference("general.appversion.override", "5.0 (X11)")
 
-            # Set user agent
-            firefox_options.set_preference("general.useragent.override", self.rotate_user_agent())
+            firefox_options.set_preference("intl.accept_languages", "hr-HR, hr, en-US, en")
+
+            # Set user agent; remembered so the stealth script can match it without asking the page
+            self._session_user_agent = self.rotate_user_agent()
+            firefox_options.set_preference("general.useragent.override", self._session_user_agent)
 
             # Privacy and security preferences
             firefox_options.set_preference("privacy.trackingprotection.enabled", False)
@@ -464,25 +1157,62 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             firefox_options.set_preference("fission.autostart", False)
 
             # Performance preferences
+            # In-memory HTTP cache only: shared CSS/JS is fetched once per session, nothing hits disk
             firefox_options.set_preference("browser.cache.disk.enable", False)
-            firefox_options.set_preference("browser.cache.memory.enable", False)
+            firefox_options.set_preference("browser.cache.memory.enable", True)
+            firefox_options.set_preference("browser.cache.memory.capacity", 262144)  # KB
+            firefox_options.set_preference("browser.cache.memory.max_entry_size", 10240)  # KB
             firefox_options.set_preference("browser.cache.offline.enable", False)
-            firefox_options.set_preference("network.http.use-cache", False)
-
-            # Configure profile directory to avoid permission issues
-            # Use a dedicated session directory instead of system temp
-            sessions_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "firefoxsessions", "scraper")
-            os.makedirs(sessions_dir, exist_ok=True)
+            firefox_options.set_preference("network.http.use-cache", True)
+
+            # Asset blocking: nothing the scraper parses needs images, media, fonts or trackers
+            if self.block_assets:
+                firefox_options.set_preference("permissions.default.image", 2)
+                firefox_options.set_preference("permissions.default.desktop-notification", 2)
+                firefox_options.set_preference("media.autoplay.default", 5)
+                firefox_options.set_preference("media.autoplay.blocking_policy", 2)
+                firefox_options.set_preference("gfx.downloadable_fonts.enabled", False)
+                firefox_options.set_preference("browser.display.use_document_fonts", 0)
+                firefox_options.set_preference("browser.contentblocking.category", "strict")
+                firefox_options.set_preference("privacy.trackingprotection.enabled", True)
+
+            # Keep resolved hosts and idle connections for the whole session
+            firefox_options.set_preference("network.dnsCacheExpiration", 3600)
+            firefox_options.set_preference("network.dnsCacheExpirationGracePeriod", 600)
+            firefox_options.set_preference("network.dnsCacheEntries", 4000)
+            firefox_options.set_preference("network.http.keep-alive.timeout", 600)
+
+            # Multiplex requests over few warm TLS connections
+            firefox_options.set_preference("network.http.http2.enabled", True)
+            firefox_options.set_preference("network.http.max-persistent-connections-per-server", 10)
+            firefox_options.set_preference("network.http.max-connections", 256)
+            firefox_options.set_preference("security.tls.enable_0rtt_data", True)
+
+            # Reuse a persistent profile so cookies, HSTS and certificate state survive between runs
+            profile_dir = self._acquire_persistent_profile()
+            if profile_dir:
+                firefox_options.add_argument("-profile")
+                firefox_options.add_argument(profile_dir)
+                # Never reopen tabs from a previous run that did not shut down cleanly
+                firefox_options.set_preference("browser.sessionstore.resume_from_crash", False)
+                self.logger.info(f"📁 Using persistent Firefox profile: {profile_dir}")
+            else:
+                # Configure profile directory to avoid permission issues
+                # Use a dedicated session directory instead of system temp
+                sessions_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "firefoxsessions", "scraper")
+                os.makedirs(sessions_dir, exist_ok=True)
 
-            from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
-            profile = FirefoxProfile(sessions_dir)
-            firefox_options.profile = profile
+                from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+                profile = FirefoxProfile(sessions_dir)
+                firefox_options.profile = profile
+                # FirefoxProfile copies the template into a fresh temp dir; remove it in close()
+                self._profile_tmpdir = getattr(profile, 'tempfolder', None)
 
-            self.logger.info(f"📁 Using Firefox profile directory: {sessions_dir}")
+                self.logger.info(f"📁 Using Firefox profile directory: {sessions_dir}")
 
             # Server compatibility - override headless setting to ensure it's properly set
             if self.headless:
-                firefox_options.headless = True
+                firefox_options.add_argument("-headless")
 
             # Set window size for consistency
             width = random.randint(1366, 1920)
@@ -490,7 +1220,11 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
             # Setup Firefox service with explicit geckodriver path and logging
             geckodriver_path = "/usr/local/bin/geckodriver"
-            service = Service(geckodriver_path, log_output=os.path.join(tempfile.gettempdir(), "geckodriver.log"))
+            service = Service(
+                geckodriver_path,
+                log_output=os.path.join(tempfile.gettempdir(), "geckodriver.log"),
+                env=self._geckodriver_env(),
+            )
 
             self.logger.info("🔧 Starting Firefox WebDriver (with retry logic)...")
             max_retries = 3
@@ -501,14 +1235,15 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                     if attempt > 0:
                         self.logger.info(f"🔄 Retry attempt {attempt + 1}/{max_retries}")
                         # Clean up any stale geckodriver processes
-                        import subprocess
                         try:
                             subprocess.run(['pkill', '-9', 'geckodriver'], timeout=2, stderr=subprocess.DEVNULL)
                             time.sleep(1)
-                        except:
+                        except (OSError, subprocess.SubprocessError):
                             pass
 
-                    self.driver = webdriver.Firefox(service=service, options=firefox_options)
+                    # keep_alive reuses one HTTP connection to geckodriver for every command
+                    self.driver = webdriver.Firefox(service=service, options=firefox_options, keep_alive=True)
+                    self._track_driver_process()
                     self.logger.info("✅ Firefox WebDriver started successfully")
                     break
 
@@ -533,10 +1268,9 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
                     # Try to clean up any zombie processes
                     try:
-                        import subprocess
                         subprocess.run(['pkill', '-9', 'firefox'], timeout=2, stderr=subprocess.DEVNULL)
                         subprocess.run(['pkill', '-9', 'geckodriver'], timeout=2, stderr=subprocess.DEVNULL)
-                    except:
+                    except (OSError, subprocess.SubprocessError):
                         pass
 
                     raise
@@ -546,9 +1280,12 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
             # Apply stealth patches on the blank startup page
             self._inject_stealth_scripts()
+            if self.block_assets:
+                self._install_asset_blocker()
 
-            # Set realistic timeouts
-            self.driver.implicitly_wait(5)
+            # Set realistic timeouts; no implicit wait, so a missing fallback selector fails
+            # immediately instead of stalling (page readiness uses WebDriverWait)
+            self.driver.implicitly_wait(0)
             self.driver.set_page_load_timeout(20)
 
             logger.info("Firefox browser setup completed successfully with enhanced anti-detection")
@@ -558,8 +1295,220 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.error(f"Failed to setup Firefox browser: {e}")
             return False
 
-    def download_sitemap_index(self) -> Optional[str]:
-        """Download and parse the sitemap index XML using browser. Checks for local file first."""
+    def _driver_alive(self) -> bool:
+        """Whether self.driver still has a responsive session."""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _acquire_persistent_profile(self, max_slots: int = 32) -> Optional[str]:
+        """
+        Lock the first free persistent profile slot under PERSISTENT_PROFILE_ROOT.
+
+        Each slot is held with an exclusive flock for the lifetime of the browser,
+        so parallel scrapers never share a profile; only _quit_driver() releases it. Stale slots are pruned on
+        acquisition and leaked tmpfs profiles are purged.
+
+        Args:
+            max_slots: Number of slot directories to try before giving up
+
+        Returns:
+            Path of the locked profile directory, or None if none is available
+        """
+        _purge_leaked_tmp_profiles(PROFILE_MAX_AGE_DAYS)
+
+        for slot in range(max_slots):
+            path = os.path.join(PERSISTENT_PROFILE_ROOT, f"slot-{slot}")
+            try:
+                os.makedirs(path, exist_ok=True)
+                fd = os.open(os.path.join(path, ".njuskalo.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            except OSError as e:
+                logger.debug(f"Persistent profile unavailable, using a temporary one: {e}")
+                return None
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+
+            self._profile_lock_fd = fd
+            _prune_profile_dir(path, PROFILE_MAX_AGE_DAYS)
+            return path
+
+        logger.debug(f"All {max_slots} persistent profile slots are in use, using a temporary one")
+        return None
+
+    def _release_persistent_profile(self) -> None:
+        """Release the persistent profile slot lock held by this scraper, if any."""
+        if self._profile_lock_fd is not None:
+            try:
+                os.close(self._profile_lock_fd)
+            except OSError:
+                pass
+            self._profile_lock_fd = None
+
+    def _geckodriver_env(self) -> Dict[str, str]:
+        """Environment for geckodriver with TMPDIR on tmpfs, so Firefox profile I/O stays in RAM."""
+        env = dict(os.environ)
+        if os.path.isdir("/dev/shm"):
+            try:
+                os.makedirs(PROFILE_TMPFS_DIR, exist_ok=True)
+                env["TMPDIR"] = PROFILE_TMPFS_DIR
+            except OSError as e:
+                logger.debug(f"tmpfs profile dir unavailable, using default TMPDIR: {e}")
+        return env
+
+    def _track_driver_process(self) -> None:
+        """Remember the geckodriver PID and make sure the browser is torn down at interpreter exit."""
+        try:
+            self._driver_pid = self.driver.service.process.pid
+        except AttributeError:
+            self._driver_pid = None
+        self._watch_driver()
+
+    def _watch_driver(self) -> None:
+        """
+        Quit self.driver if this scraper is collected or the interpreter exits first.
+
+        weakref.finalize only references the driver, so the scraper itself stays
+        collectable; _quit_driver() detaches the finalizer.
+        """
+        self._unwatch_driver()
+        self._driver_finalizer = weakref.finalize(
+            self, _finalize_webdriver, self.driver, self._driver_pid, self._profile_tmpdir
+        )
+
+    def _unwatch_driver(self) -> None:
+        """Drop the exit-time teardown of the current driver (it was quit or handed off)."""
+        if self._driver_finalizer is not None:
+            self._driver_finalizer.detach()
+            self._driver_finalizer = None
+
+    def _quit_driver(self, timeout: float = 5.0) -> None:
+        """
+        Quit the browser, remove its temporary profile copy and release its profile slot.
+
+        If driver.quit() does not return within `timeout` seconds the geckodriver
+        process tree (including Firefox) is killed so no zombie browsers pile up.
+        """
+        driver, pid = self.driver, self._driver_pid
+        self.driver = None
+        self._driver_pid = None
+        self._unwatch_driver()
+
+        try:
+            if driver:
+                quit_webdriver(driver, pid, timeout)
+        finally:
+            if self._profile_tmpdir:
+                shutil.rmtree(self._profile_tmpdir, ignore_errors=True)
+                self._profile_tmpdir = None
+            self._release_persistent_profile()
+
+    def _get_html(self, url: str, operation_type: str = "page_load", ttl_s: Optional[int] = None) -> Optional[str]:
+        """
+        Return the page source for a URL, using the local snapshot cache when enabled.
+
+        With a positive TTL, a snapshot younger than ttl_s seconds is returned from
+        datadump/.cache/ without touching the browser; otherwise the page is loaded
+        (with the usual delay and human behavior) and the snapshot is refreshed.
+
+        Args:
+            url: Page to fetch
+            operation_type: smart_sleep profile applied after a real page load
+            ttl_s: Snapshot lifetime in seconds (defaults to self.page_cache_ttl, 0 disables)
+
+        Returns:
+            Page source, or None if navigation failed
+        """
+        ttl_s = self.page_cache_ttl if ttl_s is None else ttl_s
+        cache_path = os.path.join(PAGE_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".html")
+
+        if ttl_s > 0:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < ttl_s:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        logger.debug(f"Using cached snapshot for {url}")
+                        return f.read()
+            except OSError:
+                pass
+
+        if not self.navigate_to(url):
+            return None
+
+        self.smart_sleep(operation_type)
+        self.add_human_behavior()
+        html = self.driver.page_source
+
+        if ttl_s > 0:
+            try:
+                os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    f.write(html)
+            except OSError as e:
+                logger.debug(f"Could not write snapshot for {url}: {e}")
+
+        return html
+
+    def _sync_session_cookies(self) -> None:
+        """
+        Copy the browser's cookies and user agent into self.session, once per browser session.
+
+        The base URL is loaded only if the browser holds no cookies yet. Without a
+        browser the session fetches anonymously.
+        """
+        if not self.driver:
+            return
+        session_id = getattr(self.driver, 'session_id', None)
+        if self._session_cookies_synced_for == session_id:
+            return
+
+        try:
+            cookies = self.driver.get_cookies()
+            if not cookies and self.navigate_to(self.base_url):
+                cookies = self.driver.get_cookies()
+            self.session.cookies.update({cookie['name']: cookie['value'] for cookie in cookies})
+            user_agent = getattr(self, '_session_user_agent', None) or self.driver.execute_script("return navigator.userAgent;")
+            if user_agent:
+                self.session.headers['User-Agent'] = user_agent
+            self._session_cookies_synced_for = session_id
+        except WebDriverException as e:
+            logger.debug(f"Could not copy browser cookies to HTTP session: {e}")
+
+    def _http_get(self, url: str, timeout: int = 30, sync_cookies: bool = True) -> Optional[bytes]:
+        """
+        Fetch a static resource (sitemap XML, .gz) over the keep-alive HTTP session.
+
+        Args:
+            url: Resource to fetch
+            timeout: Request timeout in seconds
+            sync_cookies: Copy browser cookies first; False off the main thread,
+                which must never touch the WebDriver session
+
+        Returns:
+            Response body (transfer encoding already decoded), or None on failure
+        """
+        if sync_cookies:
+            self._sync_session_cookies()
+        try:
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    def download_sitemap_index(self) -> Optional[Union[str, bytes]]:
+        """
+        Download the sitemap index XML over HTTP, falling back to the browser. Checks for local file first.
+
+        Returns raw bytes when fetched over HTTP (fed straight to the parser) and
+        str from the local file or the browser.
+        """
         # Check for local sitemap index file first - use realpath for reliability
         script_dir = os.path.dirname(os.path.realpath(__file__))
         local_sitemap_path = os.path.join(script_dir, 'sitemap-index.xml')
@@ -574,18 +1523,18 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             except Exception as e:
                 logger.warning(f"⚠️ Failed to read local sitemap, falling back to download: {e}")
 
+        content = self._http_get(self.sitemap_index_url)
+        if content is not None:
+            logger.info(f"Downloaded sitemap index over HTTP ({len(content)} bytes)")
+            return content
+
         try:
             logger.info(f"Downloading sitemap index with browser from: {self.sitemap_index_url}")
 
-            # Navigate to the sitemap index URL
-            self.navigate_to(self.sitemap_index_url)
-
-            # Enhanced delay and human behavior
-            self.smart_sleep("sitemap_download")
-            self.add_human_behavior()
-
-            # Get the page source
-            xml_content = self.driver.page_source
+            # Navigate to the sitemap index URL (or reuse a fresh local snapshot)
+            xml_content = self._get_html(self.sitemap_index_url, operation_type="sitemap_download")
+            if xml_content is None:
+                raise RuntimeError(f"Navigation failed for {self.sitemap_index_url}")
 
             # Clean up the content - remove HTML wrapper if present
             if '<html' in xml_content.lower():
@@ -608,34 +1557,26 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             self.smart_sleep("error_recovery")
             return None
 
-    def parse_sitemap_index(self, xml_content: str) -> List[str]:
-        """Parse sitemap index and extract URLs of individual sitemaps."""
+    def parse_sitemap_index(self, xml_content) -> List[str]:
+        """Parse sitemap index (str or bytes) and extract URLs of individual sitemaps."""
         sitemap_urls = []
 
         try:
-            root = ET.fromstring(xml_content)
-
-            # Handle namespace
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-
             # Prioritize store-specific sitemaps
             store_sitemaps = []
             seller_sitemaps = []
             other_sitemaps = []
 
-            for sitemap in root.findall('.//ns:sitemap', namespace):
-                loc_element = sitemap.find('ns:loc', namespace)
-                if loc_element is not None:
-                    sitemap_url = loc_element.text.strip()
-
-                    if 'stores' in sitemap_url.lower() or 'trgovina' in sitemap_url:
-                        store_sitemaps.append(sitemap_url)
-                        logger.info(f"Found store sitemap: {sitemap_url}")
-                    elif 'seller' in sitemap_url.lower():
-                        seller_sitemaps.append(sitemap_url)
-                        logger.info(f"Found seller sitemap: {sitemap_url}")
-                    else:
-                        other_sitemaps.append(sitemap_url)
+            for sitemap_url in _iter_sitemap_locs(xml_content, 'sitemap'):
+                lower_url = sitemap_url.lower()
+                if _is_store_sitemap(lower_url):
+                    store_sitemaps.append(sitemap_url)
+                    logger.info(f"Found store sitemap: {sitemap_url}")
+                elif 'seller' in lower_url:
+                    seller_sitemaps.append(sitemap_url)
+                    logger.info(f"Found seller sitemap: {sitemap_url}")
+                else:
+                    other_sitemaps.append(sitemap_url)
 
             # Combine with priority: stores first, then sellers, then others
             sitemap_urls = store_sitemaps + seller_sitemaps + other_sitemaps
@@ -647,20 +1588,27 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.error(f"Failed to parse sitemap index: {e}")
             return []
 
-    def download_sitemap_with_browser(self, sitemap_url: str) -> Optional[str]:
-        """Download sitemap using browser for non-gzipped files."""
-        try:
-            logger.info(f"Downloading sitemap with browser: {sitemap_url}")
+    def download_sitemap_with_browser(self, sitemap_url: str) -> Optional[Union[str, bytes]]:
+        """
+        Download a non-gzipped sitemap over HTTP, falling back to a browser page load.
 
-            # Navigate to the sitemap URL
-            self.navigate_to(sitemap_url)
+        HTTP responses are returned as raw bytes; only the browser fallback needs
+        its XML-viewer HTML wrapper stripped.
+        """
+        content = self._http_get(sitemap_url)
+        if content is not None:
+            if b'<urlset' in content or b'<sitemapindex' in content:
+                logger.info(f"Downloaded sitemap over HTTP ({len(content)} bytes)")
+                return content
+            logger.warning(f"HTTP response for {sitemap_url} is not sitemap XML, retrying with browser")
 
-            # Enhanced delay and behavior simulation
-            self.smart_sleep("sitemap_download")
-            self.add_human_behavior()
+        try:
+            logger.info(f"Downloading sitemap with browser: {sitemap_url}")
 
-            # Get the page source
-            xml_content = self.driver.page_source
+            # Navigate to the sitemap URL (or reuse a fresh local snapshot)
+            xml_content = self._get_html(sitemap_url, operation_type="sitemap_download")
+            if xml_content is None:
+                raise RuntimeError(f"Navigation failed for {sitemap_url}")
 
             # Clean up the content - remove HTML wrapper if present
             if '<html' in xml_content.lower() and '<?xml' in xml_content:
@@ -688,89 +1636,69 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.error(f"Failed to download sitemap {sitemap_url} with browser: {e}")
             return None
 
-    def download_gz_file_with_browser(self, gz_url: str) -> Optional[str]:
-        """Download and decompress a .gz file using browser session."""
-        try:
-            logger.info(f"Downloading .gz file: {gz_url}")
-
-            # First, navigate to establish browser session and cookies
-            self.navigate_to(self.base_url)
-            time.sleep(random.uniform(0.5, 1.0))
-
-            # Get cookies from browser session
-            cookies = {}
-            for cookie in self.driver.get_cookies():
-                cookies[cookie['name']] = cookie['value']
-
-            # Use requests session with browser cookies and headers
-            headers = {
-                'User-Agent': self.driver.execute_script("return navigator.userAgent;"),
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9,hr;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'same-origin',
-                'Upgrade-Insecure-Requests': '1',
-            }
+    def download_gz_file_with_browser(self, gz_url: str, sync_cookies: bool = True) -> Optional[bytearray]:
+        """
+        Download a .gz sitemap over the HTTP session and inflate it while it streams in.
 
-            # Download the .gz file
-            response = self.session.get(gz_url, headers=headers, cookies=cookies, timeout=30)
-            response.raise_for_status()
+        The compressed body is never held in full; urllib3 undoes any HTTP
+        Content-Encoding and GzipFile inflates the file in READ_BUFFER_SIZE chunks.
+        The inflated XML is returned as the bytearray it was read into (no extra
+        copy); the sitemap parser and its regex fallback read it directly.
 
-            logger.info(f"Downloaded .gz file ({len(response.content)} bytes)")
+        Args:
+            gz_url: Sitemap to fetch
+            sync_cookies: Copy browser cookies first (False in worker threads)
+        """
+        logger.info(f"Downloading .gz file: {gz_url}")
+        if sync_cookies:
+            self._sync_session_cookies()
 
-            # Decompress the content
-            try:
-                xml_content = gzip.decompress(response.content).decode('utf-8')
-                logger.info(f"Successfully decompressed .gz file ({len(xml_content)} characters)")
-                return xml_content
-            except Exception as decompress_error:
-                logger.error(f"Failed to decompress .gz file: {decompress_error}")
-                # Try to use content as-is in case it's not actually compressed
-                try:
-                    xml_content = response.content.decode('utf-8')
-                    if '<?xml' in xml_content or '<urlset' in xml_content:
-                        logger.info("Content was not compressed, using as-is")
-                        return xml_content
-                except Exception:
-                    pass
-                return None
+        try:
+            with self.session.get(gz_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                xml_bytes = bytearray()
+                with gzip.GzipFile(fileobj=response.raw) as gz:
+                    while True:
+                        chunk = gz.read(READ_BUFFER_SIZE)
+                        if not chunk:
+                            break
+                        xml_bytes += chunk
 
-        except Exception as e:
+            logger.info(f"Successfully decompressed .gz file ({len(xml_bytes)} bytes)")
+            return xml_bytes
+
+        except (requests.RequestException, OSError, EOFError) as e:
             logger.error(f"Failed to download .gz file {gz_url}: {e}")
             return None
 
-    def extract_store_urls(self, xml_content: str) -> List[str]:
-        """Extract store URLs (trgovina) from sitemap XML."""
+    def extract_store_urls(self, xml_content, limit: Optional[int] = None) -> List[str]:
+        """
+        Extract store URLs (trgovina) from sitemap XML (str or bytes), streaming the document.
+
+        Args:
+            xml_content: Sitemap XML
+            limit: Stop parsing once this many store URLs are found (None reads the whole sitemap)
+        """
         store_urls = []
 
         try:
-            root = ET.fromstring(xml_content)
-
-            # Handle namespace
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-
-            for url in root.findall('.//ns:url', namespace):
-                loc_element = url.find('ns:loc', namespace)
-                if loc_element is not None:
-                    url_text = loc_element.text.strip()
-                    # Check if URL contains 'trgovina' (store in Croatian)
-                    if '/trgovina/' in url_text:
-                        store_urls.append(url_text)
+            # Check if URL contains 'trgovina' (store in Croatian)
+            store_urls = list(itertools.islice(
+                (url_text for url_text in _iter_sitemap_locs(xml_content, 'url') if '/trgovina/' in url_text),
+                limit,
+            ))
 
             logger.info(f"Found {len(store_urls)} store URLs in this sitemap")
             return store_urls
 
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.warning(f"XML parsing failed: {e}")
             # Try regex fallback
             try:
-                import re
-                url_pattern = r'<loc>(https://[^<]*?/trgovina/[^<]+)</loc>'
-                matches = re.findall(url_pattern, xml_content)
-                store_urls = matches
+                if isinstance(xml_content, str):
+                    xml_content = xml_content.encode('utf-8')
+                store_urls = [match.decode('utf-8', errors='replace') for match in _TRGOVINA_LOC_RE.findall(xml_content)][:limit]
                 logger.info(f"Regex fallback found {len(store_urls)} store URLs")
                 return store_urls
             except Exception as regex_e:
@@ -809,10 +1737,54 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.warning(f"Failed to add car filter to URL {url}: {e}")
             return url
 
-    def detect_vehicle_flags(self) -> Dict[str, int]:
+    def _parse_page_source(self, html: Optional[str] = None) -> BeautifulSoup:
+        """
+        Fetch the current page source once and parse it with lxml.
+
+        Script/style content is dropped so get_text() matches what the browser
+        renders, letting callers run all their selectors in-process instead of
+        making a WebDriver call per element.
+
+        Args:
+            html: Page source already read by the caller, to avoid fetching it twice
+        """
+        soup = BeautifulSoup(html if html is not None else self.driver.page_source, 'lxml')
+        for tag in soup(['script', 'style', 'noscript', 'template']):
+            tag.decompose()
+        return soup
+
+    def _extract_elements_batch(self, selector: str) -> List[Dict]:
+        """
+        Read text, href, class and disabled state of all elements matching a selector.
+
+        One execute_script call replaces a find_elements plus per-element
+        .text/get_attribute round trips.
+
+        Returns:
+            List of dicts with 'text', 'href', 'className' and 'disabled' keys
+        """
+        try:
+            return self.driver.execute_script(_ELEMENTS_BATCH_JS, selector) or []
+        except WebDriverException as e:
+            logger.debug(f"Element batch read failed for {selector}: {e}")
+            return []
+
+    @staticmethod
+    def _select_first_matching(soup, selectors: List[str]) -> list:
+        """Return the elements of the first selector (in priority order) that matches anything."""
+        for selector in selectors:
+            found = soup.select(selector)
+            if found:
+                return found
+        return []
+
+    def detect_vehicle_flags(self, soup: Optional[BeautifulSoup] = None) -> Dict[str, int]:
         """
         Detect vehicle flags on the current page using enhanced selectors.
 
+        Args:
+            soup: Current page already parsed by the caller (parsed here if omitted)
+
         Returns:
             Dictionary with 'new_count' and 'used_count' keys
         """
@@ -820,41 +1792,37 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
         used_count = 0
 
         try:
+            # One page_source fetch; every lookup below runs on the parsed tree
+            if soup is None:
+                soup = self._parse_page_source()
+
             # Primary method: Look for specific vehicle flags in li.entity-flag span.flag elements
-            flag_elements = self.driver.find_elements(By.CSS_SELECTOR, "li.entity-flag span.flag")
+            flag_elements = soup.select("li.entity-flag span.flag")
             if flag_elements:
                 logger.debug(f"Found {len(flag_elements)} entity-flag elements")
                 for flag_element in flag_elements:
-                    try:
-                        flag_text = flag_element.text.lower()
-                        if 'novo vozilo' in flag_text:
-                            new_count += 1
-                            logger.debug(f"Found 'Novo vozilo' flag: {flag_text}")
-                        elif 'rabljeno vozilo' in flag_text:
-                            used_count += 1
-                            logger.debug(f"Found 'Rabljeno vozilo' flag: {flag_text}")
-                    except Exception as e:
-                        logger.debug(f"Error reading flag text: {e}")
-                        continue
+                    flag_text = flag_element.get_text(' ', strip=True).lower()
+                    if 'novo vozilo' in flag_text:
+                        new_count += 1
+                        logger.debug(f"Found 'Novo vozilo' flag: {flag_text}")
+                    elif 'rabljeno vozilo' in flag_text:
+                        used_count += 1
+                        logger.debug(f"Found 'Rabljeno vozilo' flag: {flag_text}")
 
                 # Return early if we found flags using the primary method
                 if new_count > 0 or used_count > 0:
                     return {'new_count': new_count, 'used_count': used_count}
 
             # Secondary method: Look for flags in broader entity-flag containers
-            flag_containers = self.driver.find_elements(By.CSS_SELECTOR, "li.entity-flag")
+            flag_containers = soup.select("li.entity-flag")
             if flag_containers:
                 logger.debug(f"Found {len(flag_containers)} entity-flag containers")
                 for container in flag_containers:
-                    try:
-                        container_text = container.text.lower()
-                        if 'novo vozilo' in container_text:
-                            new_count += 1
-                        elif 'rabljeno vozilo' in container_text:
-                            used_count += 1
-                    except Exception as e:
-                        logger.debug(f"Error reading container text: {e}")
-                        continue
+                    container_text = container.get_text(' ', strip=True).lower()
+                    if 'novo vozilo' in container_text:
+                        new_count += 1
+                    elif 'rabljeno vozilo' in container_text:
+                        used_count += 1
 
                 # Return if we found any flags
                 if new_count > 0 or used_count > 0:
@@ -869,22 +1837,13 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 '.classified-item'
             ]
 
-            for selector in ad_selectors:
-                try:
-                    ad_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if ad_elements:
-                        for ad_element in ad_elements:
-                            try:
-                                ad_text = ad_element.text.lower()
-                                if 'novo vozilo' in ad_text:
-                                    new_count += 1
-                                elif 'rabljeno vozilo' in ad_text:
-                                    used_count += 1
-                            except Exception:
-                                continue
-                        break  # Exit after first successful selector
-                except Exception:
-                    continue
+            # Only the first selector that matches anything is used
+            for ad_element in self._select_first_matching(soup, ad_selectors):
+                ad_text = ad_element.get_text(' ', strip=True).lower()
+                if 'novo vozilo' in ad_text:
+                    new_count += 1
+                elif 'rabljeno vozilo' in ad_text:
+                    used_count += 1
 
         except Exception as e:
             logger.warning(f"Error in vehicle flag detection: {e}")
@@ -929,8 +1888,9 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                     logger.warning(f"Page {page} failed to load")
                     break
 
-                # Use enhanced vehicle flag detection
-                page_counts = self.detect_vehicle_flags()
+                # Use enhanced vehicle flag detection; the same parse feeds the text fallback
+                soup = self._parse_page_source()
+                page_counts = self.detect_vehicle_flags(soup)
                 page_new_count = page_counts['new_count']
                 page_used_count = page_counts['used_count']
 
@@ -940,9 +1900,9 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 # If no ads found with standard selectors, try searching page text
                 if not ads_found:
                     try:
-                        page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                        page_new_count = page_text.count('novo vozilo')
-                        page_used_count = page_text.count('rabljeno vozilo')
+                        phrase_counts = count_vehicle_phrases((soup.body or soup).get_text(" ", strip=True).lower())
+                        page_new_count = phrase_counts['novo']
+                        page_used_count = phrase_counts['rabljeno']
 
                         # If we found vehicle mentions, consider this a valid page
                         if page_new_count > 0 or page_used_count > 0:
@@ -965,13 +1925,12 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                     '[data-testid="next-page"]'
                 ]
 
-                for selector in next_selectors:
+                for next_element in self.driver.find_elements(By.CSS_SELECTOR, ", ".join(next_selectors)):
                     try:
-                        next_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                         if next_element.is_enabled() and not next_element.get_attribute('disabled'):
                             next_page_exists = True
                             break
-                    except NoSuchElementException:
+                    except WebDriverException:
                         continue
 
                 # Also check if we found no ads on this page (might indicate end)
@@ -988,6 +1947,27 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
         logger.info(f"Total vehicle counts - New: {new_count}, Used: {used_count}")
         return result
 
+    @staticmethod
+    def _iter_match_texts(soup: BeautifulSoup, selectors: List[str]) -> Iterator[str]:
+        """
+        Yield the text of the first element matching each selector, in priority order.
+
+        Lazy, so callers that stop at the first usable value never run the
+        lower-priority selectors.
+
+        Args:
+            soup: Parsed page from _parse_page_source()
+            selectors: CSS selectors to look up, highest priority first
+
+        Yields:
+            Stripped text for each selector that matched an element
+        """
+        for selector in selectors:
+            matcher = _COMPILED_SELECTORS.get(selector) or soupsieve.compile(selector)
+            element = matcher.select_one(soup)
+            if element is not None:
+                yield element.get_text(" ", strip=True)
+
     def scrape_store_info(self, store_url: str) -> Optional[Dict]:
         """Scrape information from a store page."""
         try:
@@ -1009,6 +1989,10 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             # Additional delay before data extraction
             self.smart_sleep("data_extraction")
 
+            # Read the page once; every selector and regex below runs on this snapshot
+            html = self.driver.page_source
+            soup = self._parse_page_source(html)
+
             store_data = {
                 'url': store_url,
                 'name': None,
@@ -1021,70 +2005,33 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 'error': None
             }
 
+            # Body text is extracted and scanned at most once per page, only if a fallback needs it
+            text_scan = None
+
             # Extract store name
             try:
-                name_selectors = [
-                    'h1',
-                    '.store-name',
-                    '.shop-name',
-                    '.entity-name',
-                    '[data-testid="store-name"]',
-                    '.profile-header h1',
-                    '.seller-info h1',
-                    '.store-title'
-                ]
-
-                for selector in name_selectors:
-                    try:
-                        name_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        store_data['name'] = name_element.text.strip()
-                        if store_data['name']:
-                            break
-                    except NoSuchElementException:
-                        continue
+                for name_text in self._iter_match_texts(soup, STORE_NAME_SELECTORS):
+                    store_data['name'] = name_text
+                    if store_data['name']:
+                        break
 
             except Exception as e:
                 logger.warning(f"Could not extract store name: {e}")
 
             # Extract address - try multiple approaches
             try:
-                address_selectors = [
-                    '.store-address',
-                    '.shop-address',
-                    '.address',
-                    '[data-testid="store-address"]',
-                    '.contact-info .address',
-                    '.store-info .address',
-                    '.profile-info .address',
-                    '.seller-contact',
-                    '.contact-details'
-                ]
-
-                for selector in address_selectors:
-                    try:
-                        address_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        address_text = address_element.text.strip()
-                        if address_text and len(address_text) > 5:  # Basic validation
-                            store_data['address'] = address_text
-                            break
-                    except NoSuchElementException:
-                        continue
+                for address_text in self._iter_match_texts(soup, STORE_ADDRESS_SELECTORS):
+                    if len(address_text) > 5:  # Basic validation
+                        store_data['address'] = address_text
+                        break
 
                 # If no address found via CSS selectors, try text search
                 if not store_data['address']:
                     try:
-                        page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                        # Look for Croatian city patterns or postal codes
-                        address_patterns = [
-                            r'\d{5}\s+[A-ZČĆŽŠĐ][a-zčćžšđ]+',  # Postal code + city
-                            r'[A-ZČĆŽŠĐ][a-zčćžšđ]+\s+\d+[a-z]?',  # Street + number
-                        ]
-
-                        for pattern in address_patterns:
-                            matches = re.findall(pattern, page_text)
-                            if matches:
-                                store_data['address'] = matches[0]
-                                break
+                        if text_scan is None:
+                            text_scan = _scan_store_text((soup.body or soup).get_text(" ", strip=True))
+                        # Croatian postal code + city, else street + number
+                        store_data['address'] = text_scan['address']
                     except Exception:
                         pass
 
@@ -1093,42 +2040,20 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
             # Extract ads count from entities-count class and similar
             try:
-                count_selectors = [
-                    '.entities-count',
-                    '.ads-count',
-                    '.listings-count',
-                    '[data-testid="entities-count"]',
-                    '.entity-count',
-                    '.total-ads'
-                ]
-
-                for selector in count_selectors:
-                    try:
-                        count_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        ads_text = count_element.text.strip()
-                        # Extract number from text like "123 oglasa", "45 ads", or just "67"
-                        ads_match = re.search(r'(\d+)', ads_text)
-                        if ads_match:
-                            store_data['ads_count'] = int(ads_match.group(1))
-                            break
-                    except NoSuchElementException:
-                        continue
+                for count_text in self._iter_match_texts(soup, STORE_COUNT_SELECTORS):
+                    # Extract number from text like "123 oglasa", "45 ads", or just "67"
+                    ads_match = _ADS_DIGIT_RE.search(count_text)
+                    if ads_match:
+                        store_data['ads_count'] = int(ads_match.group(1))
+                        break
 
                 # If no specific count element found, look in page text
                 if store_data['ads_count'] is None:
                     try:
-                        page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                        # Look for Croatian patterns like "X oglasa" or "X objava"
-                        count_patterns = [
-                            r'(\d+)\s+oglas[ai]',  # "123 oglasa" or "1 oglas"
-                            r'(\d+)\s+objav[ae]',  # "123 objave" or "1 objava"
-                        ]
-
-                        for pattern in count_patterns:
-                            matches = re.findall(pattern, page_text, re.IGNORECASE)
-                            if matches:
-                                store_data['ads_count'] = int(matches[0])
-                                break
+                        if text_scan is None:
+                            text_scan = _scan_store_text((soup.body or soup).get_text(" ", strip=True))
+                        # Croatian patterns like "X oglasa" or "X objava"
+                        store_data['ads_count'] = text_scan['ads_count']
                     except Exception:
                         pass
 
@@ -1137,62 +2062,48 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
             # Check for Auto moto category (categoryId 2)
             try:
-                # Look for category links or elements that might indicate Auto moto
-                category_selectors = [
-                    'a[href*="categoryId=2"]',
-                    'a[href*="/auti"]',
-                    'a[href*="/auto"]',
-                    'a[href*="/moto"]',
-                    '.category-link',
-                    '[data-category-id="2"]',
-                    '.category-item'
-                ]
-
                 categories_found = []
 
-                # Check page source for category indicators
-                page_source = self.driver.page_source.lower()
-                if 'categoryid=2' in page_source or 'categoryid%3d2' in page_source:
-                    store_data['has_auto_moto'] = True
-
-                for selector in category_selectors:
+                # One pass over the parsed page; elements matching several selectors are listed once
+                for element in _CATEGORY_MATCHER.select(soup):
                     try:
-                        category_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in category_elements:
-                            try:
-                                category_text = element.text.strip()
-                                category_href = element.get_attribute('href') or ''
-
-                                categories_found.append({
-                                    'text': category_text,
-                                    'href': category_href
-                                })
-
-                                # Check if this is Auto moto category
-                                if ('categoryId=2' in category_href or
-                                    'categoryid=2' in category_href.lower() or
-                                    'auti' in category_href.lower() or
-                                    'auto' in category_text.lower() or
-                                    'moto' in category_text.lower() or
-                                    'vozila' in category_text.lower()):
-                                    store_data['has_auto_moto'] = True
-                            except Exception:
-                                continue
-
+                        category_text = element.get_text(" ", strip=True)
+                        href = element.get('href')
+                        category_href = urljoin(filtered_url, href) if href else ''
+
+                        categories_found.append({
+                            'text': category_text,
+                            'href': category_href
+                        })
+
+                        # Check if this is Auto moto category (only until one link has matched)
+                        if not store_data['has_auto_moto']:
+                            lower_href = category_href.lower()
+                            lower_category = category_text.lower()
+                            if ('categoryid=2' in lower_href or
+                                'auti' in lower_href or
+                                'auto' in lower_category or
+                                'moto' in lower_category or
+                                'vozila' in lower_category):
+                                store_data['has_auto_moto'] = True
                     except Exception:
                         continue
 
                 store_data['categories'] = categories_found
 
+                # Check page source for category indicators, unless a link already decided it
+                if not store_data['has_auto_moto']:
+                    page_source = html.lower()
+                    if 'categoryid=2' in page_source or 'categoryid%3d2' in page_source:
+                        store_data['has_auto_moto'] = True
+
                 # Additional check: look for auto-related keywords in page text
                 if not store_data['has_auto_moto']:
-                    page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                    auto_keywords = ['automobil', 'vozilo', 'auto', 'motocikl', 'motor']
-                    if any(keyword in page_text for keyword in auto_keywords):
-                        # Additional validation - these keywords should appear multiple times
-                        keyword_count = sum(page_text.count(keyword) for keyword in auto_keywords)
-                        if keyword_count >= 3:  # Threshold to avoid false positives
-                            store_data['has_auto_moto'] = True
+                    if text_scan is None:
+                        text_scan = _scan_store_text((soup.body or soup).get_text(" ", strip=True))
+                    # Keywords should appear multiple times to avoid false positives
+                    if text_scan['auto_keywords'] >= 3:
+                        store_data['has_auto_moto'] = True
 
             except Exception as e:
                 logger.warning(f"Could not check for Auto moto category: {e}")
@@ -1226,17 +2137,101 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 'error': str(e)
             }
 
-    def discover_and_add_new_urls(self) -> List[str]:
+    def _fetch_sitemap_store_urls(self, sitemap_url: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Download one sitemap over HTTP and extract its store URLs (safe to run in a thread).
+
+        Never touches the driver, even when the up-front cookie sync in
+        _collect_store_urls failed; the session then fetches anonymously.
+
+        Args:
+            sitemap_url: Sitemap to fetch (.xml or .xml.gz)
+            limit: Stop parsing the sitemap after this many store URLs
+
+        Returns:
+            Store URLs found, or None if the sitemap needs the browser fallback
+        """
+        if sitemap_url.endswith('.gz'):
+            xml_content = self.download_gz_file_with_browser(sitemap_url, sync_cookies=False)
+        else:
+            xml_content = self._http_get(sitemap_url, sync_cookies=False)
+            if xml_content is not None and b'<urlset' not in xml_content and b'<sitemapindex' not in xml_content:
+                logger.warning(f"HTTP response for {sitemap_url} is not sitemap XML, retrying with browser")
+                xml_content = None
+
+        if not xml_content:
+            return None
+        return self.extract_store_urls(xml_content, limit=limit)
+
+    def _collect_store_urls(self, sitemap_urls: List[str], limit: Optional[int] = None) -> set:
+        """
+        Fetch sitemaps concurrently over the HTTP session and gather their store URLs.
+
+        Plain sitemaps that HTTP could not serve are retried one by one through the
+        browser afterwards, since the WebDriver session is not shared across threads.
+
+        Args:
+            sitemap_urls: Sitemaps to fetch
+            limit: Cancel the remaining downloads once this many store URLs are found
+
+        Returns:
+            Set of store URLs found
+        """
+        store_urls = set()
+        if not sitemap_urls:
+            return store_urls
+
+        # Copy cookies once up front so worker threads never touch the driver
+        self._sync_session_cookies()
+
+        browser_fallback = []
+        with ThreadPoolExecutor(max_workers=min(SITEMAP_FETCH_WORKERS, len(sitemap_urls))) as executor:
+            futures = {executor.submit(self._fetch_sitemap_store_urls, url, limit): url for url in sitemap_urls}
+            for future in as_completed(futures):
+                sitemap_url = futures[future]
+                try:
+                    found = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to process sitemap {sitemap_url}: {e}")
+                    continue
+                if found is None:
+                    if sitemap_url.endswith('.gz'):
+                        logger.warning(f"Failed to download stores XML: {sitemap_url}")
+                    else:
+                        browser_fallback.append(sitemap_url)
+                    continue
+                store_urls.update(found)
+                if limit is not None and len(store_urls) >= limit:
+                    logger.info(f"Found {len(store_urls)} store URLs, skipping the remaining sitemaps")
+                    for pending in futures:
+                        pending.cancel()
+                    return store_urls
+
+        for sitemap_url in browser_fallback:
+            xml_content = self.download_sitemap_with_browser(sitemap_url)
+            if not xml_content:
+                logger.warning(f"Skipping sitemap due to download failure: {sitemap_url}")
+                continue
+            store_urls.update(self.extract_store_urls(xml_content, limit=limit))
+            if limit is not None and len(store_urls) >= limit:
+                break
+
+        return store_urls
+
+    def discover_and_add_new_urls(self, limit: Optional[int] = None) -> List[str]:
         """
         Discover new store URLs from sitemaps and add them to the database.
 
+        Args:
+            limit: Stop reading sitemaps once this many store URLs are found
+
         Returns:
             List of new URLs that were added to the database
         """
         logger.info("Starting URL discovery process...")
 
         # Get all store URLs from sitemaps
-        all_store_urls = self._get_all_store_urls_from_sitemaps()
+        all_store_urls = self._get_all_store_urls_from_sitemaps(limit=limit)
 
         if not all_store_urls:
             logger.warning("No store URLs found in sitemaps")
@@ -1285,11 +2280,14 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
 
         return new_urls
 
-    def _get_all_store_urls_from_sitemaps(self) -> List[str]:
+    def _get_all_store_urls_from_sitemaps(self, limit: Optional[int] = None) -> List[str]:
         """
         Get all store URLs from sitemaps without scraping individual stores.
         Checks for local sitemap file first.
 
+        Args:
+            limit: Stop reading sitemaps once this many store URLs are found
+
         Returns:
             List of all store URLs found in sitemaps
         """
@@ -1340,7 +2338,7 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             # Step 3: Focus on stores sitemap specifically
             stores_sitemap_found = False
             for sitemap_url in sitemap_urls:
-                if 'stores' in sitemap_url.lower() or 'trgovina' in sitemap_url.lower():
+                if _is_store_sitemap(sitemap_url.lower()):
                     logger.info(f"Processing stores sitemap for URL discovery: {sitemap_url}")
                     stores_sitemap_found = True
 
@@ -1353,26 +2351,11 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                     # Parse to get the actual stores XML.gz file URLs
                     stores_xml_urls = self.parse_sitemap_index(stores_sitemap_content)
 
-                    # Process each stores XML file (usually .xml.gz files)
-                    for stores_xml_url in stores_xml_urls:
-                        logger.info(f"Processing stores XML file for URLs: {stores_xml_url}")
-
-                        # Check if it's a .gz file and use appropriate download method
-                        if stores_xml_url.endswith('.gz'):
-                            stores_xml_content = self.download_gz_file_with_browser(stores_xml_url)
-                        else:
-                            stores_xml_content = self.download_sitemap_with_browser(stores_xml_url)
-
-                        if not stores_xml_content:
-                            logger.warning(f"Failed to download stores XML: {stores_xml_url}")
-                            continue
-
-                        # Extract store URLs from this XML
-                        store_urls = self.extract_store_urls(stores_xml_content)
-                        all_store_urls.update(store_urls)
-
-                        # Delay between XML downloads (reduced)
-                        time.sleep(random.uniform(0.3, 0.7))
+                    # Fetch the stores XML files (usually .xml.gz) concurrently
+                    logger.info(f"Processing {len(stores_xml_urls)} stores XML files for URLs")
+                    all_store_urls.update(self._collect_store_urls(stores_xml_urls, limit=limit))
+                    if limit is not None and len(all_store_urls) >= limit:
+                        break
 
                     # Delay between sitemap processing (reduced)
                     time.sleep(random.uniform(0.3, 0.7))
@@ -1380,21 +2363,7 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             # If no stores sitemap found, process all sitemaps as fallback
             if not stores_sitemap_found:
                 logger.info("No specific stores sitemap found, processing all sitemaps for URL discovery")
-                for sitemap_url in sitemap_urls:
-                    logger.info(f"Processing sitemap for URL discovery: {sitemap_url}")
-
-                    # Download and extract sitemap
-                    sitemap_content = self.download_sitemap_with_browser(sitemap_url)
-                    if not sitemap_content:
-                        logger.warning(f"Skipping sitemap due to download failure: {sitemap_url}")
-                        continue
-
-                    # Extract store URLs from this sitemap
-                    store_urls = self.extract_store_urls(sitemap_content)
-                    all_store_urls.update(store_urls)
-
-                    # Small delay between sitemap downloads (reduced)
-                    time.sleep(random.uniform(0.3, 0.7))
+                all_store_urls.update(self._collect_store_urls(sitemap_urls, limit=limit))
 
             return list(all_store_urls)
 
@@ -1402,8 +2371,102 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.error(f"Error during URL discovery: {e}")
             return []
 
-    def run_full_scrape(self, max_stores: int = None, initialize_db: bool = True) -> List[Dict]:
+    def _flush_pending(self) -> None:
+        """Write queued store saves and invalid-URL marks in one transaction each."""
+        saves, self._pending_saves = self._pending_saves, []
+        invalids, self._pending_invalids = self._pending_invalids, []
+        if not (self.use_database and self.database):
+            return
+
+        if saves and self.database.save_stores_bulk(saves) != len(saves):
+            logger.warning(f"Failed to save batch of {len(saves)} stores to database")
+        if invalids and self.database.mark_urls_invalid(invalids) != len(invalids):
+            logger.warning(f"Failed to mark {len(invalids)} URLs as invalid in database")
+
+    def run_full_scrape(self, max_stores: int = None, initialize_db: bool = True,
+                        workers: int = 1) -> List[Dict]:
         """Run the optimized scraping workflow that focuses on auto moto stores."""
+        for store_data in self.iter_stores(max_stores=max_stores, initialize_db=initialize_db,
+                                           workers=workers):
+            self.stores_data.append(store_data)
+        return self.stores_data
+
+    def _scrape_stores_sequentially(self, store_urls: List[str]) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Scrape stores one by one with this instance's browser, pausing between visits.
+
+        Args:
+            store_urls: Store URLs to scrape
+
+        Yields:
+            (store_url, store_data) pairs; store_data is None when scraping failed
+        """
+        for i, store_url in enumerate(store_urls, 1):
+            logger.info(f"Processing store {i}/{len(store_urls)}: {store_url}")
+
+            try:
+                yield store_url, self.scrape_store_info(store_url)
+            except Exception as e:
+                logger.error(f"Error processing store {store_url}: {e}")
+                yield store_url, None
+
+            # Enhanced random delay between store visits with progress-based scaling
+            progress_factor = i / len(store_urls)
+
+            # Increase delays as we progress to avoid pattern detection
+            if progress_factor > 0.7:  # After 70% completion, use longer delays
+                self.smart_sleep("store_visit", min_seconds=12.0, max_seconds=25.0)
+            else:
+                self.smart_sleep("store_visit")
+
+            # Occasionally add extra long breaks (every 10-15 stores)
+            if i % random.randint(10, 15) == 0:
+                extra_delay = random.uniform(30, 60)
+                logger.info(f"Taking extended break: {extra_delay:.1f}s after {i} stores")
+                # Collect cyclic garbage (parsed soups, WebElements) while idle anyway
+                gc.collect()
+                time.sleep(extra_delay)
+
+    def _scrape_stores_in_pool(self, store_urls: List[str], workers: int) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        Scrape stores across a process pool with one browser per worker.
+
+        Each worker keeps the usual pause between its own visits, so the target
+        sees at most `workers` concurrent sessions at the sequential pace.
+
+        Args:
+            store_urls: Store URLs to scrape
+            workers: Number of worker processes
+
+        Yields:
+            (store_url, store_data) pairs in input order
+        """
+        workers = max(1, min(workers, len(store_urls)))
+        logger.info(f"Scraping {len(store_urls)} stores with {workers} worker processes")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.headless, True, self.block_assets)) as executor:
+            for i, (store_url, store_data) in enumerate(
+                    zip(store_urls, executor.map(_scrape_one, store_urls)), 1):
+                logger.info(f"Processed store {i}/{len(store_urls)}: {store_url}")
+                yield store_url, store_data
+
+    def iter_stores(self, max_stores: int = None, initialize_db: bool = True,
+                    workers: int = 1) -> Iterator[Dict]:
+        """
+        Run the optimized scraping workflow, yielding each store as it is scraped.
+
+        Stores are saved to the database as they arrive and are not kept on the
+        instance, so callers that only need a count or streaming output use O(1) memory.
+
+        Args:
+            max_stores: Maximum number of stores to scrape
+            initialize_db: Connect and create tables before scraping
+            workers: Number of parallel browser processes (1 scrapes in this process)
+
+        Yields:
+            Scraped store data dicts
+        """
         try:
             logger.info("Starting optimized Njuskalo sitemap scraping workflow")
 
@@ -1418,8 +2481,10 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                     logger.error(f"Failed to initialize database: {e}")
                     self.use_database = False  # Fall back to non-database mode
 
-            # Step 1: Discover and add new URLs to database
-            new_urls = self.discover_and_add_new_urls()
+            # Step 1: Discover and add new URLs to database. Without a database every
+            # discovered URL is scraped, so discovery can stop at max_stores.
+            discovery_limit = max_stores if max_stores and not (self.use_database and self.database) else None
+            new_urls = self.discover_and_add_new_urls(limit=discovery_limit)
             logger.info(f"URL discovery completed. Found {len(new_urls)} new URLs")
 
             # Step 2: Determine which stores to scrape
@@ -1450,22 +2515,24 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 stores_to_scrape = stores_to_scrape[:max_stores]
                 logger.info(f"Limited to first {len(stores_to_scrape)} stores for testing")
 
-            # Step 3: Setup browser for scraping
-            if not self.setup_browser():
+            # Step 3: Setup browser for scraping (pool workers start their own)
+            if workers > 1 and stores_to_scrape:
+                results = self._scrape_stores_in_pool(stores_to_scrape, workers)
+            elif self.setup_browser():
+                results = self._scrape_stores_sequentially(stores_to_scrape)
+            else:
                 logger.error("Failed to setup browser")
-                return []
+                return
 
             # Step 4: Scrape selected stores
+            scraped_count = 0
             auto_moto_count = 0
             non_auto_moto_count = 0
 
-            for i, store_url in enumerate(stores_to_scrape, 1):
-                logger.info(f"Processing store {i}/{len(stores_to_scrape)}: {store_url}")
-
+            for store_url, store_data in results:
                 try:
-                    store_data = self.scrape_store_info(store_url)
                     if store_data:
-                        self.stores_data.append(store_data)
+                        scraped_count += 1
 
                         # Track auto moto vs non-auto moto
                         if store_data.get('has_auto_moto'):
@@ -1473,46 +2540,28 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                         else:
                             non_auto_moto_count += 1
 
-                        # Save to database if enabled
+                        # Queue for the next batched database write
                         if self.use_database and self.database:
                             is_valid = store_data.get('error') is None
-                            success = self.database.save_store_data(
-                                url=store_url,
-                                store_data=store_data,
-                                is_valid=is_valid
-                            )
-                            if success:
-                                logger.debug(f"Saved store data to database: {store_url}")
-                            else:
-                                logger.warning(f"Failed to save store data to database: {store_url}")
+                            self._pending_saves.append((store_url, dict(store_data), is_valid))
+
+                        yield store_data
                     else:
-                        # Mark URL as invalid in database
+                        # Queue URL to be marked invalid in database
                         if self.use_database and self.database:
-                            self.database.mark_url_invalid(store_url)
-                            logger.debug(f"Marked URL as invalid in database: {store_url}")
+                            self._pending_invalids.append(store_url)
 
                 except Exception as e:
                     logger.error(f"Error processing store {store_url}: {e}")
-                    # Mark as invalid in database
+                    # Queue URL to be marked invalid in database
                     if self.use_database and self.database:
-                        self.database.mark_url_invalid(store_url)
-
-                # Enhanced random delay between store visits with progress-based scaling
-                progress_factor = i / len(stores_to_scrape)
+                        self._pending_invalids.append(store_url)
 
-                # Increase delays as we progress to avoid pattern detection
-                if progress_factor > 0.7:  # After 70% completion, use longer delays
-                    self.smart_sleep("store_visit", min_seconds=12.0, max_seconds=25.0)
-                else:
-                    self.smart_sleep("store_visit")
+                if len(self._pending_saves) + len(self._pending_invalids) >= DB_BATCH_SIZE:
+                    self._flush_pending()
 
-                # Occasionally add extra long breaks (every 10-15 stores)
-                if i % random.randint(10, 15) == 0:
-                    extra_delay = random.uniform(30, 60)
-                    logger.info(f"Taking extended break: {extra_delay:.1f}s after {i} stores")
-                    time.sleep(extra_delay)
-
-            logger.info(f"Completed scraping {len(self.stores_data)} stores")
+            self._flush_pending()
+            logger.info(f"Completed scraping {scraped_count} stores")
             logger.info(f"Auto moto stores: {auto_moto_count}, Non-auto moto stores: {non_auto_moto_count}")
 
             # Print database statistics if enabled
@@ -1523,19 +2572,18 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 except Exception as e:
                     logger.warning(f"Failed to get database stats: {e}")
 
-            return self.stores_data
-
         except Exception as e:
             logger.error(f"Error in optimized scrape workflow: {e}")
-            return self.stores_data
         finally:
             # Clean up database connection
             if self.use_database and self.database:
                 try:
+                    self._flush_pending()
                     self.database.disconnect()
                     logger.info("Database connection closed")
                 except Exception as e:
                     logger.warning(f"Error closing database connection: {e}")
+            gc.collect()
 
     def run_auto_moto_only_scrape(self, max_stores: int = None) -> List[Dict]:
         """
@@ -1637,6 +2685,103 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 except Exception as e:
                     logger.warning(f"Error closing database connection: {e}")
 
+    @classmethod
+    def scrape_many(cls, urls: List[str], max_workers: int = 4, headless: bool = True) -> "NjuskaloSitemapScraper":
+        """
+        Scrape store URLs in parallel across a process pool.
+
+        Each worker process owns a single browser for its whole lifetime, so HTML
+        parsing and WebDriver traffic run outside this interpreter's GIL.
+
+        Args:
+            urls: Store URLs to scrape
+            max_workers: Number of worker processes (one browser each)
+            headless: Whether worker browsers run headless
+
+        Returns:
+            Scraper instance with the merged results in stores_data
+        """
+        scraper = cls(headless=headless, use_database=False)
+        if not urls:
+            return scraper
+
+        workers = max(1, min(max_workers, len(urls)))
+        logger.info(f"Scraping {len(urls)} stores with {workers} worker processes")
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(headless,)) as executor:
+            for store_data in executor.map(_scrape_one, urls):
+                if store_data:
+                    scraper.stores_data.append(store_data)
+
+        logger.info(f"Completed parallel scraping of {len(scraper.stores_data)} stores")
+        return scraper
+
+    def stream_to_csv(self, filename: str = None, max_stores: int = None, workers: int = 1) -> int:
+        """
+        Run the full scrape and append each store to a CSV file as it is scraped.
+
+        Unlike run_full_scrape() + save_to_excel(), stores are not collected on
+        the instance, so memory stays flat for any run length. Rows are flushed
+        every DB_BATCH_SIZE stores (in step with the database batches) and when
+        the file closes, including on an interrupt.
+
+        Args:
+            filename: CSV file name inside datadump/ (default: timestamped)
+            max_stores: Maximum number of stores to scrape
+            workers: Number of parallel browser processes
+
+        Returns:
+            Number of rows written
+        """
+        filename = _export_path(filename, ".csv")
+
+        written = 0
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS)
+            for store in self.iter_stores(max_stores=max_stores, workers=workers):
+                written += 1
+                writer.writerow(_export_values(written, store))
+                if written % DB_BATCH_SIZE == 0:
+                    f.flush()
+
+        logger.info(f"Streamed {written} stores to {filename}")
+        return written
+
+    def save_to_csv(self, filename: str = None) -> bool:
+        """
+        Save scraped data to a CSV file in datadump directory.
+
+        Same columns as save_to_excel(), without the xlsx packaging (shared
+        strings, zip compression), so it is the faster export for large runs.
+        """
+        try:
+            if not self.stores_data:
+                logger.warning("No data to save")
+                return False
+
+            filename = _export_path(filename, ".csv")
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_COLUMNS)
+                writer.writerows(_iter_export_values(self.stores_data))
+
+            logger.info(f"Data saved to {filename}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save data to CSV: {e}")
+            return False
+
+    def save_to_excel_async(self, filename: str = None) -> Future:
+        """
+        Write the Excel export on a background thread.
+
+        Lets browser shutdown overlap with xlsx serialization; call .result()
+        on the returned future (True/False as from save_to_excel) before exiting.
+        """
+        return _EXPORT_EXECUTOR.submit(self.save_to_excel, filename)
+
     def save_to_excel(self, filename: str = None) -> bool:
         """Save scraped data to Excel file in datadump directory."""
         try:
@@ -1644,45 +2789,49 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
                 logger.warning("No data to save")
                 return False
 
-            # Create datadump directory if it doesn't exist
-            import os
-            datadump_dir = "datadump"
-            os.makedirs(datadump_dir, exist_ok=True)
-
-            if not filename:
-                timestamp = int(time.time())
-                filename = f"njuskalo_stores_{timestamp}.xlsx"
-
-            # Ensure filename goes to datadump directory
-            if not filename.startswith(datadump_dir):
-                filename = os.path.join(datadump_dir, filename)
-
-            # Prepare data for DataFrame with specific header format
-            df_data = []
-            for i, store in enumerate(self.stores_data, start=1):
-                row = {
-                    'id': i,  # Sequential ID
-                    'vat': '',  # VAT - set as empty since no data available on scraped page
-                    'name': store.get('name', ''),  # Store name
-                    'subname': store.get('subname', ''),  # Store subname/category
-                    'address': store.get('address', ''),  # Store address
-                    'total': store.get('ads_count', 0),  # Total number of ads (old ads_count)
-                    'new': store.get('new_ads_count', 0),  # New vehicle ads count
-                    'used': store.get('used_ads_count', 0),  # Used vehicle ads count
-                    'test': 0  # Test field - set to 0 for now
-                }
-                df_data.append(row)
-
-            df = pd.DataFrame(df_data)
+            filename = _export_path(filename, ".xlsx")
 
-            # Ensure columns are in the correct order
-            column_order = ['id', 'vat', 'name', 'subname', 'address', 'total', 'new', 'used', 'test']
-            df = df.reindex(columns=column_order)
+            # Native writer straight from the row dicts, no DataFrame in between
+            if FastExcel is not None:
+                try:
+                    rows = (_export_row(i, store) for i, store in enumerate(self.stores_data, start=1))
+                    FastExcel(filename).sheet("Sheet1", rows).save()
+                    logger.info(f"Data saved to {filename}")
+                    return True
+                except Exception as e:
+                    logger.warning(f"rustpy-xlsxwriter failed, falling back: {e}")
 
-            # Fill NaN values with empty strings for VAT column
-            df['vat'] = df['vat'].fillna('')
+            # pyexcelerate serializes a plain 2D table in one go, without per-cell dispatch
+            if pyexcelerate is not None:
+                try:
+                    workbook = pyexcelerate.Workbook()
+                    workbook.new_sheet("Sheet1", data=[EXPORT_COLUMNS, *_iter_export_values(self.stores_data)])
+                    workbook.save(filename)
+                    logger.info(f"Data saved to {filename}")
+                    return True
+                except Exception as e:
+                    logger.warning(f"pyexcelerate failed, falling back: {e}")
 
-            df.to_excel(filename, index=False)
+            # xlsxwriter in constant_memory mode flushes each row to disk as it is written
+            if xlsxwriter is not None:
+                workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+                try:
+                    _write_xlsxwriter_sheet(workbook, "Sheet1", self.stores_data)
+                finally:
+                    workbook.close()
+                logger.info(f"Data saved to {filename}")
+                return True
+
+            # openpyxl (a hard dependency) in write-only mode, straight from the row
+            # generator; imported lazily so scrape-only runs never pay for it
+            from openpyxl import Workbook
+
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet("Sheet1")
+            worksheet.append(EXPORT_COLUMNS)
+            for values in _iter_export_values(self.stores_data):
+                worksheet.append(values)
+            workbook.save(filename)
 
             logger.info(f"Data saved to {filename}")
             return True
@@ -1691,32 +2840,80 @@ class NjuskaloSitemapScraper(AntiDetectionMixin):
             logger.error(f"Failed to save data to Excel: {e}")
             return False
 
+    def save_many_to_excel(self, runs: Dict[str, List[Dict]], filename: str = None) -> bool:
+        """
+        Save several scrape results into one Excel file, one sheet per run.
+
+        Cheaper than one file per run: a single zip container, and with
+        xlsxwriter in standard mode the shared-strings table is built once
+        for all sheets (constant_memory would not share it).
+
+        Args:
+            runs: Sheet name -> store dicts (as in stores_data)
+            filename: Excel file name inside datadump/ (default: timestamped)
+
+        Returns:
+            True if the file was written
+        """
+        try:
+            if not any(runs.values()):
+                logger.warning("No data to save")
+                return False
+
+            filename = _export_path(filename, ".xlsx")
+
+            if xlsxwriter is not None:
+                workbook = xlsxwriter.Workbook(filename)
+                try:
+                    for name, stores in runs.items():
+                        _write_xlsxwriter_sheet(workbook, name, stores)
+                finally:
+                    workbook.close()
+            else:
+                from openpyxl import Workbook
+
+                workbook = Workbook(write_only=True)
+                for name, stores in runs.items():
+                    worksheet = workbook.create_sheet(name)
+                    worksheet.append(EXPORT_COLUMNS)
+                    for values in _iter_export_values(stores):
+                        worksheet.append(values)
+                workbook.save(filename)
+
+            logger.info(f"Data saved to {filename} ({len(runs)} sheets)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save data to Excel: {e}")
+            return False
+
     def close(self):
         """Clean up resources without user confirmation."""
         if self.driver:
             try:
-                self.driver.quit()
+                self._quit_driver()
                 logger.info("Browser closed successfully")
             except Exception as e:
                 logger.warning(f"Error closing browser: {e}")
                 # Force kill Firefox processes if quit fails
                 try:
-                    import subprocess
                     subprocess.run(['pkill', '-9', 'firefox'], timeout=2, stderr=subprocess.DEVNULL)
                     subprocess.run(['pkill', '-9', 'geckodriver'], timeout=2, stderr=subprocess.DEVNULL)
                     logger.info("Forcefully terminated browser processes")
                 except Exception as kill_error:
                     logger.warning(f"Could not force kill processes: {kill_error}")
 
-        if hasattr(self, 'session'):
+        if self.session is not None:
             try:
                 self.session.close()
             except Exception as e:
                 logger.warning(f"Error closing session: {e}")
+            self.session = None
 
 
 if __name__ == "__main__":
     scraper = None
+    export = None
     try:
         # Example usage - headless by default, use headless=False for manual testing/debugging
         scraper = NjuskaloSitemapScraper(headless=True)
@@ -1725,7 +2922,7 @@ if __name__ == "__main__":
         stores_data = scraper.run_full_scrape(max_stores=5)
 
         if stores_data:
-            scraper.save_to_excel()
+            export = scraper.save_to_excel_async()
 
             # Print summary
             print(f"\n📊 Scraping Summary:")
@@ -1747,7 +2944,9 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Script failed with error: {e}")
     finally:
-        # Always close browser, even on error or interrupt
+        # Always close browser, even on error or interrupt; the export keeps writing meanwhile
         if scraper:
             scraper.close()
+        if export:
+            export.result()
         logger.info("Script execution completed")
\ No newline at end of file
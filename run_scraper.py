@@ -9,6 +9,11 @@ Usage:
     python run_scraper.py --max-stores 10      # limit to 10 stores (for testing)
     python run_scraper.py --no-database        # skip database, print results only
     python run_scraper.py --no-tunnels         # disable SSH tunnels
+    python run_scraper.py --workers 3          # 3 parallel browsers per tunnel
+    python run_scraper.py --mode basic --workers 4   # basic scrape with 4 parallel browsers
+    python run_scraper.py --block-assets       # skip images/fonts/trackers while scraping
+    python run_scraper.py --mode basic --stream-csv  # append stores to a CSV as they are scraped
+    python run_scraper.py --csv                # save results as CSV instead of xlsx
     python run_scraper.py --verbose            # debug logging
 """
 
@@ -68,15 +73,19 @@ def run_tunnel_scrape(args, logger):
         tunnel_config_path=args.tunnel_config,
         use_tunnels=not args.no_tunnels,
         preferred_tunnel=args.tunnel,
+        workers=args.workers,
+        block_assets=args.block_assets,
     )
+    export = None
     try:
         results = scraper.run_enhanced_scrape_with_tunnels(max_stores=args.max_stores)
         print_results(results)
 
         if not args.no_database:
-            _save_excel(scraper, logger, prefix="tunnel")
+            export = _save_excel(scraper, logger, prefix="tunnel", as_csv=args.csv)
     finally:
         _cleanup_browser(scraper, logger)
+        _finish_excel(export, logger)
 
 
 def run_enhanced_scrape(args, logger):
@@ -87,24 +96,40 @@ def run_enhanced_scrape(args, logger):
         sys.exit(1)
 
     logger.info("Starting enhanced scrape (no tunnels)...")
-    scraper = EnhancedNjuskaloScraper(headless=args.headless, use_database=not args.no_database)
+    scraper = EnhancedNjuskaloScraper(
+        headless=args.headless,
+        use_database=not args.no_database,
+        block_assets=args.block_assets,
+    )
+    export = None
     try:
         results = scraper.run_enhanced_scrape(max_stores=args.max_stores)
         print_results(results)
 
         if not args.no_database:
-            _save_excel(scraper, logger, prefix="enhanced")
+            export = _save_excel(scraper, logger, prefix="enhanced", as_csv=args.csv)
     finally:
         _cleanup_browser(scraper, logger)
+        _finish_excel(export, logger)
 
 
 def run_basic_scrape(args, logger):
     from njuskalo_sitemap_scraper import NjuskaloSitemapScraper
 
     logger.info("Starting basic sitemap scrape...")
-    scraper = NjuskaloSitemapScraper(headless=args.headless, use_database=not args.no_database)
+    scraper = NjuskaloSitemapScraper(
+        headless=args.headless,
+        use_database=not args.no_database,
+        block_assets=args.block_assets,
+    )
+    export = None
     try:
-        stores = scraper.run_full_scrape(max_stores=args.max_stores)
+        if args.stream_csv:
+            written = scraper.stream_to_csv(max_stores=args.max_stores, workers=args.workers)
+            print(f"\n  Stores streamed to CSV: {written}")
+            return
+
+        stores = scraper.run_full_scrape(max_stores=args.max_stores, workers=args.workers)
 
         print("\n" + "=" * 60)
         print("SCRAPING RESULTS")
@@ -117,18 +142,39 @@ def run_basic_scrape(args, logger):
         print("=" * 60)
 
         if stores and not args.no_database:
-            _save_excel(scraper, logger, prefix="basic")
+            export = _save_excel(scraper, logger, prefix="basic", as_csv=args.csv)
     finally:
         _cleanup_browser(scraper, logger)
+        _finish_excel(export, logger)
 
 
-def _save_excel(scraper, logger, prefix: str):
+def _save_excel(scraper, logger, prefix: str, as_csv: bool = False):
+    """Start the Excel export in the background; pass the result to _finish_excel."""
     os.makedirs("datadump", exist_ok=True)
     timestamp = int(datetime.now().timestamp())
+    if as_csv:
+        # CSV is written in one pass; no need to overlap it with browser shutdown
+        filename = f"njuskalo_{prefix}_{timestamp}.csv"
+        if scraper.save_to_csv(filename):
+            logger.info(f"Results saved to datadump/{filename}")
+        else:
+            logger.warning("Failed to save CSV file")
+        return None
     filename = f"njuskalo_{prefix}_{timestamp}.xlsx"
     try:
-        saved = scraper.save_to_excel(filename)
-        if saved:
+        return filename, scraper.save_to_excel_async(filename)
+    except Exception as e:
+        logger.warning(f"Could not save Excel: {e}")
+        return None
+
+
+def _finish_excel(export, logger):
+    """Wait for an export started by _save_excel (after the browser is closed)."""
+    if not export:
+        return
+    filename, future = export
+    try:
+        if future.result():
             logger.info(f"Results saved to datadump/{filename}")
         else:
             logger.warning("Failed to save Excel file")
@@ -185,6 +231,13 @@ def main():
         metavar="PATH",
         help="Path to tunnel config file (default: tunnel_config.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parallel browser processes (per tunnel in tunnel mode; tunnel and basic modes, default: 1)",
+    )
     parser.add_argument(
         "--no-database",
         action="store_true",
@@ -195,6 +248,21 @@ def main():
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--stream-csv",
+        action="store_true",
+        help="Write each store to datadump/*.csv as it is scraped instead of keeping all in memory (basic mode only)",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Save results to datadump/*.csv instead of .xlsx (faster for large runs)",
+    )
+    parser.add_argument(
+        "--block-assets",
+        action="store_true",
+        help="Skip images, fonts, notifications and tracker requests (pages are parsed as text)",
+    )
     parser.add_argument(
         "--headless",
         action="store_true",
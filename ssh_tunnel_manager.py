@@ -40,6 +40,7 @@ import time
 import random
 import json
 import logging
+import functools
 import threading
 import socket
 import os
@@ -55,6 +56,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime_ns: int) -> dict:
+    """Parse a tunnel config file; cached per (path, mtime) so managers share one parse."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 @dataclass
 class SSHTunnelConfig:
     """Configuration for an SSH tunnel connection."""
@@ -69,6 +77,16 @@ class SSHTunnelConfig:
     compression: bool = True
     keep_alive: int = 60
     max_retries: int = 3
+    # Optional HTTP proxy (e.g. Squid) on remote_host, forwarded alongside the SOCKS port
+    http_proxy_port: Optional[int] = None
+    http_local_port: Optional[int] = None
+
+    @property
+    def http_forward_port(self) -> Optional[int]:
+        """Local port of the forwarded HTTP proxy, or None if this tunnel has none."""
+        if not self.http_proxy_port:
+            return None
+        return self.http_local_port or self.local_port + 1000
 
 
 class SSHTunnelManager:
@@ -100,8 +118,7 @@ class SSHTunnelManager:
             return
 
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = _read_config_file(str(config_path.resolve()), config_path.stat().st_mtime_ns)
 
             for name, config in config_data.get('tunnels', {}).items():
                 self.tunnels[name] = SSHTunnelConfig(
@@ -115,7 +132,9 @@ class SSHTunnelManager:
                     remote_port=config.get('remote_port', 8080),
                     compression=config.get('compression', True),
                     keep_alive=config.get('keep_alive', 60),
-                    max_retries=config.get('max_retries', 3)
+                    max_retries=config.get('max_retries', 3),
+                    http_proxy_port=config.get('http_proxy_port'),
+                    http_local_port=config.get('http_local_port')
                 )
 
             logger.info(f"Loaded {len(self.tunnels)} tunnel configurations")
@@ -204,8 +223,10 @@ class SSHTunnelManager:
                 stdin=subprocess.PIPE
             )
 
-            # Wait a moment for connection to establish
-            time.sleep(2)
+            # Wait until the forwarded port accepts connections (or ssh exits)
+            wait_started = time.monotonic()
+            self._wait_for_local_port(process, config.local_port)
+            logger.debug(f"Waited {(time.monotonic() - wait_started) * 1000:.0f} ms for local port {config.local_port}")
 
             # Check if process is still running
             if process.poll() is None:
@@ -226,6 +247,30 @@ class SSHTunnelManager:
             logger.error(f"Error establishing tunnel '{tunnel_name}': {e}")
             return False
 
+    def _wait_for_local_port(self, process: subprocess.Popen, port: int, timeout: float = 10.0) -> bool:
+        """
+        Poll the local forward until it accepts a connection.
+
+        Args:
+            process: SSH process providing the forward
+            port: Local port to probe
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the port became reachable while ssh was still running
+        """
+        deadline = time.monotonic() + timeout
+        while process.poll() is None:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=0.1):
+                    return True
+            except OSError:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return False
+
     def _build_ssh_command(self, config: SSHTunnelConfig) -> List[str]:
         """Build SSH command for tunnel."""
         cmd = [
@@ -243,6 +288,9 @@ class SSHTunnelManager:
             '-i', os.path.expanduser(config.private_key_path),
         ]
 
+        if config.http_forward_port:
+            cmd.extend(['-L', f'{config.http_forward_port}:{config.remote_host}:{config.http_proxy_port}'])
+
         if config.compression:
             cmd.append('-C')
 
@@ -406,6 +454,7 @@ class SSHTunnelManager:
             'http': f'socks5://127.0.0.1:{config.local_port}',
             'https': f'socks5://127.0.0.1:{config.local_port}',
             'local_port': config.local_port,
+            'http_proxy_port': config.http_forward_port,
             'tunnel_name': tunnel
         }
 
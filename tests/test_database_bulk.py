@@ -0,0 +1,95 @@
+"""
+SQLite round-trip tests for the batched store writes (temporary database file).
+
+Usage:
+    python -m pytest tests/test_database_bulk.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import NjuskaloDatabase
+from njuskalo_sitemap_scraper import NjuskaloSitemapScraper
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "njuskalo.db"))
+    with NjuskaloDatabase() as database:
+        database.create_tables()
+        yield database
+
+
+def fetch_row(db, url):
+    return db.connection.execute("SELECT * FROM scraped_stores WHERE url = ?", (url,)).fetchone()
+
+
+def test_save_stores_bulk_round_trip(db):
+    store = {
+        'name': 'Auto Centar', 'address': '10000 Zagreb', 'has_auto_moto': True,
+        'new_vehicle_count': 3, 'used_vehicle_count': 5, 'test_vehicle_count': 1,
+        'total_vehicle_count': 9, 'categories': [{'name': 'Auto Moto'}],
+    }
+    assert db.save_stores_bulk([
+        ("https://www.njuskalo.hr/trgovina/a", store, True),
+        ("https://www.njuskalo.hr/trgovina/b", {'name': 'B'}, False),
+    ]) == 2
+
+    row = fetch_row(db, "https://www.njuskalo.hr/trgovina/a")
+    assert (row['is_valid'], row['is_automoto'], row['is_parts_only']) == (1, 1, 0)
+    assert (row['new_vehicle_count'], row['used_vehicle_count'],
+            row['test_vehicle_count'], row['total_vehicle_count']) == (3, 5, 1, 9)
+    # Flag/count columns and categories are split out of the JSON blob
+    assert db.get_store_data("https://www.njuskalo.hr/trgovina/a")['results'] == {
+        'name': 'Auto Centar', 'address': '10000 Zagreb',
+    }
+    # The caller's dict is left untouched
+    assert store['has_auto_moto'] is True and 'categories' in store
+
+    assert fetch_row(db, "https://www.njuskalo.hr/trgovina/b")['is_valid'] == 0
+
+
+def test_save_stores_bulk_upserts_existing_rows(db):
+    url = "https://www.njuskalo.hr/trgovina/a"
+    db.save_stores_bulk([(url, {'name': 'Old', 'new_vehicle_count': 1}, True)])
+    db.save_stores_bulk([(url, {'name': 'New', 'new_vehicle_count': 4}, True)])
+
+    assert db.connection.execute("SELECT COUNT(*) AS n FROM scraped_stores").fetchone()['n'] == 1
+    assert fetch_row(db, url)['new_vehicle_count'] == 4
+    assert db.get_store_data(url)['results'] == {'name': 'New'}
+
+
+def test_mark_urls_invalid_updates_known_and_inserts_unknown(db):
+    known = "https://www.njuskalo.hr/trgovina/known"
+    unknown = "https://www.njuskalo.hr/trgovina/unknown"
+    db.save_stores_bulk([(known, {'name': 'Known'}, True)])
+
+    assert db.mark_urls_invalid([known, unknown]) == 2
+
+    assert fetch_row(db, known)['is_valid'] == 0
+    # Existing results are kept; new URLs get a placeholder
+    assert db.get_store_data(known)['results'] == {'name': 'Known'}
+    assert db.get_store_data(unknown)['results'] == {'error': 'URL not accessible'}
+
+
+def test_empty_batches_are_no_ops(db):
+    assert db.save_stores_bulk([]) == 0
+    assert db.mark_urls_invalid([]) == 0
+
+
+def test_flush_pending_writes_queued_stores(db):
+    scraper = NjuskaloSitemapScraper.__new__(NjuskaloSitemapScraper)
+    scraper.use_database = True
+    scraper.database = db
+    scraper._pending_saves = [("https://www.njuskalo.hr/trgovina/a", {'name': 'A'}, True)]
+    scraper._pending_invalids = ["https://www.njuskalo.hr/trgovina/gone"]
+
+    scraper._flush_pending()
+
+    assert (scraper._pending_saves, scraper._pending_invalids) == ([], [])
+    assert fetch_row(db, "https://www.njuskalo.hr/trgovina/a")['is_valid'] == 1
+    assert fetch_row(db, "https://www.njuskalo.hr/trgovina/gone")['is_valid'] == 0
@@ -0,0 +1,91 @@
+"""
+Tests for the pure store-page and sitemap parsing helpers (no browser needed).
+
+Usage:
+    python -m pytest tests/test_store_parsing.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import njuskalo_sitemap_scraper
+from njuskalo_sitemap_scraper import (
+    NjuskaloSitemapScraper, STORE_NAME_SELECTORS, _iter_sitemap_locs, _scan_store_text, count_vehicle_phrases,
+)
+
+SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def make_urlset(locs):
+    entries = "".join(f"<url><loc> {loc} </loc><lastmod>2024-01-01</lastmod></url>" for loc in locs)
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{SITEMAP_XMLNS}">{entries}</urlset>'
+
+
+def test_scan_store_text_reads_counts_address_and_keywords():
+    found = _scan_store_text(
+        "Auto Centar d.o.o. Ilica 12, 10000 Zagreb. Trenutno 42 oglasa, 3 objave. Automobili i motocikli"
+    )
+    assert found == {'ads_count': 42, 'address': '10000 Zagreb', 'auto_keywords': 4}
+
+
+def test_scan_store_text_falls_back_to_objava_and_street():
+    assert _scan_store_text("Savska 5, ukupno 7 objava") == {
+        'ads_count': 7, 'address': 'Savska 5', 'auto_keywords': 0,
+    }
+
+
+def test_scan_store_text_without_matches():
+    assert _scan_store_text("nema podataka") == {'ads_count': None, 'address': None, 'auto_keywords': 0}
+
+
+def test_count_vehicle_phrases():
+    counts = count_vehicle_phrases(
+        "novo vozilo, rabljeno vozilo, testno vozilo, polovno vozilo, novo vozilo, novovozilo"
+    )
+    assert counts == {'testno': 1, 'novo': 2, 'rabljeno': 1, 'polovno': 1}
+
+
+@pytest.mark.parametrize("convert", [str, lambda xml: xml.encode("utf-8"), lambda xml: bytearray(xml.encode("utf-8"))])
+def test_iter_sitemap_locs_accepts_str_bytes_and_bytearray(convert):
+    locs = ["https://www.njuskalo.hr/trgovina/čarobnjak", "https://www.njuskalo.hr/auti"]
+    assert list(_iter_sitemap_locs(convert(make_urlset(locs)), 'url')) == locs
+
+
+def test_iter_sitemap_locs_across_feed_chunks(monkeypatch):
+    # Tiny slices split tags and multi-byte characters between parser feeds
+    monkeypatch.setattr(njuskalo_sitemap_scraper, "READ_BUFFER_SIZE", 7)
+    locs = [f"https://www.njuskalo.hr/trgovina/ž{i}" for i in range(50)]
+    assert list(_iter_sitemap_locs(make_urlset(locs).encode("utf-8"), 'url')) == locs
+
+
+def test_iter_sitemap_locs_reads_sitemap_index_entries():
+    xml = (
+        f'<sitemapindex xmlns="{SITEMAP_XMLNS}">'
+        "<sitemap><loc>https://www.njuskalo.hr/sitemap-stores-1.xml.gz</loc></sitemap>"
+        "<sitemap><loc>https://www.njuskalo.hr/sitemap-stores-2.xml.gz</loc></sitemap>"
+        "</sitemapindex>"
+    )
+    assert list(_iter_sitemap_locs(xml, 'sitemap')) == [
+        "https://www.njuskalo.hr/sitemap-stores-1.xml.gz",
+        "https://www.njuskalo.hr/sitemap-stores-2.xml.gz",
+    ]
+
+
+def test_iter_sitemap_locs_raises_on_truncated_xml():
+    with pytest.raises(etree.XMLSyntaxError):
+        list(_iter_sitemap_locs(make_urlset(["https://www.njuskalo.hr/trgovina/a"])[:-10], 'url'))
+
+
+def test_iter_match_texts_follows_selector_priority():
+    soup = BeautifulSoup(
+        '<div class="store-name">Second</div><h1> First  </h1><div class="shop-name"></div>', 'lxml'
+    )
+    texts = NjuskaloSitemapScraper._iter_match_texts(soup, STORE_NAME_SELECTORS)
+    assert next(texts) == 'First'
+    assert list(texts) == ['Second', '']
@@ -0,0 +1,56 @@
+"""
+Vehicle counting tests for NjuskaloSitemapScraper (no browser needed).
+
+Usage:
+    python -m pytest tests/test_vehicle_counts.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from njuskalo_sitemap_scraper import NjuskaloSitemapScraper
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for count_vehicle_ads() on a static page."""
+
+    def __init__(self, page_source):
+        self.page_source = page_source
+
+    def find_element(self, by, value):
+        return object()
+
+    def find_elements(self, by, value):
+        return []
+
+
+def make_scraper(page_source):
+    scraper = NjuskaloSitemapScraper.__new__(NjuskaloSitemapScraper)
+    scraper.driver = FakeDriver(page_source)
+    scraper.navigate_to = lambda url: None
+    scraper.smart_sleep = lambda operation_type="default": None
+    scraper.add_human_behavior = lambda: None
+    return scraper
+
+
+def test_count_vehicle_ads_uses_flags():
+    html = """<html><body><ul>
+        <li class="entity-flag"><span class="flag">Novo vozilo</span></li>
+        <li class="entity-flag"><span class="flag">Rabljeno vozilo</span></li>
+        <li class="entity-flag"><span class="flag">Rabljeno vozilo</span></li>
+    </ul></body></html>"""
+    counts = make_scraper(html).count_vehicle_ads("https://www.njuskalo.hr/trgovina/test")
+    assert counts == {'new_count': 1, 'used_count': 2}
+
+
+def test_count_vehicle_ads_falls_back_to_page_text():
+    # No flag elements or ad containers, so only the page-text fallback can count these
+    html = """<html><body>
+        <p>Novo vozilo u ponudi. Još jedno novo vozilo.</p>
+        <p>Rabljeno vozilo, polovno vozilo.</p>
+        <script>var x = "novo vozilo";</script>
+    </body></html>"""
+    counts = make_scraper(html).count_vehicle_ads("https://www.njuskalo.hr/trgovina/test")
+    assert counts == {'new_count': 2, 'used_count': 1}